@@ -35,6 +35,10 @@ target_metadata =  Base.metadata
 
 
 def get_url():
+    # alembic -x shard=<name> upgrade head: every shard carries the full schema
+    shard = context.get_x_argument(as_dictionary=True).get("shard")
+    if shard is not None:
+        return settings.DATABASE_SHARDS[shard]
     return str(settings.DATABASE_URL)
 
 def run_migrations_offline() -> None:
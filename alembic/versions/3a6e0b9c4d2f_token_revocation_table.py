@@ -0,0 +1,39 @@
+"""token revocation table
+
+Revision ID: 3a6e0b9c4d2f
+Revises: 8c4e7d1f2a9b
+Create Date: 2026-10-19 14:12:08.331406
+
+Backing store for the per-worker access token denylist. Rows outlive the
+tokens they revoke by at most one access token TTL and are purged by the
+workers' listener task.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3a6e0b9c4d2f'
+down_revision: Union[str, Sequence[str], None] = '8c4e7d1f2a9b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'token_revocation',
+        sa.Column('key', sa.String(), nullable=False),
+        sa.Column('revoked_at', sa.DateTime(), nullable=False),
+        sa.Column('expires_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('key'),
+    )
+    op.create_index('ix_token_revocation_expires_at', 'token_revocation', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_token_revocation_expires_at', table_name='token_revocation')
+    op.drop_table('token_revocation')
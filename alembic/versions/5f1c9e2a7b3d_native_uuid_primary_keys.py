@@ -0,0 +1,67 @@
+"""native uuid primary keys
+
+Revision ID: 5f1c9e2a7b3d
+Revises: ab2ae2603ce9
+Create Date: 2026-10-19 10:12:41.318204
+
+Converts every id / user_id column from varchar to native uuid.
+Values that are already UUID strings are cast as-is; legacy cuid values are
+mapped deterministically to md5(id)::uuid, applied identically to primary and
+foreign keys so relationships are preserved. Systems holding old cuid user ids
+can translate them with the same expression.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5f1c9e2a7b3d'
+down_revision: Union[str, Sequence[str], None] = 'ab2ae2603ce9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+USER_FK_TABLES = ["on_boarding", "otp", "session", "password_reset_token"]
+UUID_PATTERN = "^[0-9a-f]{8}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{12}$"
+
+
+def _to_uuid(column: str) -> str:
+    return f"CASE WHEN {column} ~* '{UUID_PATTERN}' THEN {column}::uuid ELSE md5({column})::uuid END"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in USER_FK_TABLES:
+        op.drop_constraint(f"{table}_user_id_fkey", table, type_="foreignkey")
+
+    op.alter_column(
+        "user", "id", type_=postgresql.UUID(as_uuid=False), postgresql_using=_to_uuid("id")
+    )
+    for table in USER_FK_TABLES:
+        for column in ("id", "user_id"):
+            op.alter_column(
+                table, column, type_=postgresql.UUID(as_uuid=False), postgresql_using=_to_uuid(column)
+            )
+
+    for table in USER_FK_TABLES:
+        op.create_foreign_key(
+            f"{table}_user_id_fkey", table, "user", ["user_id"], ["id"], ondelete="CASCADE"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema. Ids stay in their UUID text form; original cuids are not restored."""
+    for table in USER_FK_TABLES:
+        op.drop_constraint(f"{table}_user_id_fkey", table, type_="foreignkey")
+
+    op.alter_column("user", "id", type_=sa.String(), postgresql_using="id::text")
+    for table in USER_FK_TABLES:
+        for column in ("id", "user_id"):
+            op.alter_column(table, column, type_=sa.String(), postgresql_using=f"{column}::text")
+
+    for table in USER_FK_TABLES:
+        op.create_foreign_key(
+            f"{table}_user_id_fkey", table, "user", ["user_id"], ["id"], ondelete="CASCADE"
+        )
@@ -0,0 +1,45 @@
+"""covering lower(email) index on user
+
+Revision ID: 8c4e7d1f2a9b
+Revises: 5f1c9e2a7b3d
+Create Date: 2026-10-19 11:03:27.904512
+
+Replaces the plain unique constraint on user.email with a unique index on
+lower(email) that INCLUDEs the columns read by login, OTP and password reset
+lookups, so those queries can be served by an index-only scan. Built
+CONCURRENTLY to avoid locking the user table; creation fails if existing
+emails collide case-insensitively.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c4e7d1f2a9b'
+down_revision: Union[str, Sequence[str], None] = '5f1c9e2a7b3d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('UPDATE "user" SET email = lower(btrim(email)) WHERE email <> lower(btrim(email))')
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_user_email_lower',
+            'user',
+            [sa.text('lower(email)')],
+            unique=True,
+            postgresql_include=['email', 'id', 'password', 'is_email_verified'],
+            postgresql_concurrently=True,
+        )
+    op.drop_constraint('user_email_key', 'user', type_='unique')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_unique_constraint('user_email_key', 'user', ['email'])
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_user_email_lower', table_name='user', postgresql_concurrently=True)
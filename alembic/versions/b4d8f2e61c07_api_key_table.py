@@ -0,0 +1,45 @@
+"""api key table
+
+Revision ID: b4d8f2e61c07
+Revises: 3a6e0b9c4d2f
+Create Date: 2026-10-19 15:40:52.118730
+
+Per-client backend API keys, stored as SHA-256 digests with scopes and an
+optional per-minute rate limit. The shared BACKEND_API_KEY keeps working
+alongside them.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4d8f2e61c07'
+down_revision: Union[str, Sequence[str], None] = '3a6e0b9c4d2f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'api_key',
+        sa.Column('id', sa.Uuid(as_uuid=False), nullable=False),
+        sa.Column('client_name', sa.String(), nullable=False),
+        sa.Column('key_prefix', sa.String(), nullable=False),
+        sa.Column('key_hash', sa.String(length=64), nullable=False),
+        sa.Column('scopes', postgresql.ARRAY(sa.String()), nullable=False),
+        sa.Column('rate_limit_per_minute', sa.Integer(), nullable=True),
+        sa.Column('is_active', sa.Boolean(), nullable=False),
+        sa.Column('expires_at', sa.DateTime(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('key_hash'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('api_key')
@@ -0,0 +1,60 @@
+"""auth_event partitioned audit table
+
+Revision ID: d1a7c3f95e20
+Revises: b4d8f2e61c07
+Create Date: 2026-10-19 16:55:14.602198
+
+Append-only audit log range-partitioned by month on occurred_at. Creates the
+partitions for the current and next month plus a DEFAULT partition as a
+safety net; later months are created ahead of time by the application.
+"""
+from datetime import date, datetime
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd1a7c3f95e20'
+down_revision: Union[str, Sequence[str], None] = 'b4d8f2e61c07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _month(d: date, offset: int) -> date:
+    months = d.year * 12 + d.month - 1 + offset
+    return date(months // 12, months % 12 + 1, 1)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        """
+        CREATE TABLE auth_event (
+            id uuid NOT NULL,
+            occurred_at timestamp without time zone NOT NULL,
+            event_type varchar NOT NULL,
+            outcome varchar NOT NULL,
+            user_id uuid,
+            email varchar,
+            ip_address varchar,
+            user_agent varchar,
+            detail jsonb,
+            PRIMARY KEY (id, occurred_at)
+        ) PARTITION BY RANGE (occurred_at)
+        """
+    )
+    op.execute('CREATE INDEX ix_auth_event_user_id_occurred_at ON auth_event (user_id, occurred_at)')
+    today = datetime.utcnow().date()
+    for offset in range(2):
+        start, end = _month(today, offset), _month(today, offset + 1)
+        op.execute(
+            f"CREATE TABLE auth_event_{start:%Y_%m} PARTITION OF auth_event "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+    op.execute('CREATE TABLE auth_event_default PARTITION OF auth_event DEFAULT')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('DROP TABLE auth_event')
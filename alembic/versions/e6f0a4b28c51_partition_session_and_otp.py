@@ -0,0 +1,82 @@
+"""partition session and otp by expires_at
+
+Revision ID: e6f0a4b28c51
+Revises: d1a7c3f95e20
+Create Date: 2026-10-19 18:21:40.775013
+
+Rebuilds session and otp as tables range-partitioned by day on expires_at,
+so expired rows are removed by dropping whole partitions
+(`python -m app.cli.partitions`) instead of row-by-row deletes. The
+partition key has to be part of the primary key, which becomes
+(id, expires_at). Only unexpired rows are copied over. Both tables are
+rewritten under an exclusive lock; run this in a maintenance window.
+password_reset_token stays unpartitioned: its unique token constraint
+cannot be enforced across partitions.
+"""
+from datetime import datetime, timedelta
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6f0a4b28c51'
+down_revision: Union[str, Sequence[str], None] = 'd1a7c3f95e20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+DAYS_AHEAD = 14
+TABLE_INDEXES = {
+    "session": {
+        "ix_session_user_id": "user_id",
+        "ix_session_device_id": "device_id",
+        "ix_session_refresh_token": "refresh_token",
+    },
+    "otp": {},
+}
+
+
+def _rename_old(table: str) -> None:
+    op.execute(f'ALTER TABLE "{table}" RENAME TO "{table}_old"')
+    op.execute(f'ALTER INDEX "{table}_pkey" RENAME TO "{table}_old_pkey"')
+    for index in TABLE_INDEXES[table]:
+        op.execute(f'ALTER INDEX "{index}" RENAME TO "{index}_old"')
+
+
+def _add_keys_and_indexes(table: str, primary_key: str) -> None:
+    op.execute(f'ALTER TABLE "{table}" ADD CONSTRAINT "{table}_pkey" PRIMARY KEY ({primary_key})')
+    op.execute(
+        f'ALTER TABLE "{table}" ADD CONSTRAINT "{table}_user_id_fkey" '
+        f'FOREIGN KEY (user_id) REFERENCES "user" (id) ON DELETE CASCADE'
+    )
+    for index, column in TABLE_INDEXES[table].items():
+        op.execute(f'CREATE INDEX "{index}" ON "{table}" ({column})')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    today = datetime.utcnow().date()
+    for table in TABLE_INDEXES:
+        _rename_old(table)
+        op.execute(f'CREATE TABLE "{table}" (LIKE "{table}_old" INCLUDING DEFAULTS) PARTITION BY RANGE (expires_at)')
+        _add_keys_and_indexes(table, "id, expires_at")
+        for offset in range(DAYS_AHEAD + 1):
+            start = today + timedelta(days=offset)
+            op.execute(
+                f'CREATE TABLE "{table}_{start:%Y_%m_%d}" PARTITION OF "{table}" '
+                f"FOR VALUES FROM ('{start.isoformat()}') TO ('{(start + timedelta(days=1)).isoformat()}')"
+            )
+        # Catches rows outside the pre-created range if maintenance falls behind
+        op.execute(f'CREATE TABLE "{table}_default" PARTITION OF "{table}" DEFAULT')
+        op.execute(f'INSERT INTO "{table}" SELECT * FROM "{table}_old" WHERE expires_at >= \'{today.isoformat()}\'')
+        op.execute(f'DROP TABLE "{table}_old"')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLE_INDEXES:
+        _rename_old(table)
+        op.execute(f'CREATE TABLE "{table}" (LIKE "{table}_old" INCLUDING DEFAULTS)')
+        _add_keys_and_indexes(table, "id")
+        op.execute(f'INSERT INTO "{table}" SELECT * FROM "{table}_old"')
+        op.execute(f'DROP TABLE "{table}_old"')
@@ -0,0 +1,29 @@
+import os
+
+from fastapi import APIRouter, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse
+
+from app.core.profiler import MAX_PROFILE_SECONDS, profile_worker
+
+router = APIRouter(prefix="/api/v1/admin", tags=["admin"])
+
+
+@router.post("/profile", response_class=PlainTextResponse)
+async def profile(
+    seconds: float = Query(10.0, gt=0, le=MAX_PROFILE_SECONDS),
+    interval_ms: float = Query(5.0, ge=1, le=1000),
+    all_threads: bool = Query(False, description="also sample executor and background threads"),
+):
+    """
+    Sample the worker that receives this request for `seconds` and return
+    collapsed stacks ("frame;frame;frame count" per line) for flamegraph.pl,
+    speedscope or inferno. With several workers, each call profiles one of them.
+    """
+    try:
+        collapsed = await profile_worker(seconds, interval_ms / 1000, all_threads)
+    except RuntimeError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    return PlainTextResponse(
+        collapsed,
+        headers={"Content-Disposition": f'attachment; filename="profile-{os.getpid()}.collapsed"'},
+    )
@@ -1,8 +1,9 @@
-from fastapi import APIRouter, Depends, Response, Request
+from fastapi import APIRouter, Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.database import get_db_session
 from app.schemas.login_schema import LoginSchema, LoginResponse
 from app.services.login_service import login_service
+from app.core.responses import ORJSONResponse
 
 router = APIRouter(prefix="/api/v1", tags=["auth"])
 
@@ -10,7 +11,6 @@ router = APIRouter(prefix="/api/v1", tags=["auth"])
 @router.post("/login", response_model=LoginResponse)
 async def login(
     payload: LoginSchema,
-    response: Response,
     request: Request,  # Add request to extract headers and client info
     db: AsyncSession = Depends(get_db_session),
 ):
@@ -20,6 +20,8 @@ async def login(
     access_token, refresh_token = await login_service(
         payload, db, device_id=device_id, ip_address=ip_address, user_agent=user_agent
     )
+    # Returned directly so FastAPI skips re-validating the response model
+    response = ORJSONResponse(LoginResponse(access_token=access_token))
     # Set refresh token as HTTP-only cookie
     response.set_cookie(
         key="refresh_token",
@@ -29,4 +31,4 @@ async def login(
         samesite="lax",
         secure=True,
     )
-    return LoginResponse(access_token=access_token)
+    return response
@@ -1,11 +1,29 @@
 from fastapi import APIRouter, Depends, Response, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.db.database import get_db_session
+from app.db.database import get_db_session, shard_map
 from app.db.models.session_model import Session
+from app.services.token_revocation import revoke_session_tokens
+from app.services.audit_log import audit_log, request_context
+from app.db.models.enums_model import AuthEventType
+from app.utils.jwt_utils import decode_refresh_token
 
 router = APIRouter(prefix="/api/v1", tags=["auth"])
 
 
+async def _end_session(db: AsyncSession, refresh_token: str):
+    result = await db.execute(
+        Session.__table__.delete()
+        .where(Session.refresh_token == refresh_token)
+        .returning(Session.id, Session.user_id)
+    )
+    session = result.one_or_none()
+    if session is not None:
+        # Access tokens carry the session id as "sid"; deny them cluster-wide
+        await revoke_session_tokens(db, session.id)
+    await db.commit()
+    return session
+
+
 @router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
 async def logout(
     request: Request,
@@ -14,9 +32,19 @@ async def logout(
 ):
     refresh_token = request.cookies.get("refresh_token")
     if refresh_token:
-        await db.execute(
-            Session.__table__.delete().where(Session.refresh_token == refresh_token)
-        )
-        await db.commit()
+        session = await _end_session(db, refresh_token)
+        if session is None and shard_map.sharded:
+            # The token's "shard" claim may predate a reshard: follow the user
+            user_id = (decode_refresh_token(refresh_token) or {}).get("sub")
+            shard = await shard_map.find_user(user_id, exclude=db.info.get("shard")) if user_id else None
+            if shard is not None:
+                async with shard_map.session(shard) as shard_db:
+                    session = await _end_session(shard_db, refresh_token)
+        if session is not None:
+            await audit_log.record(
+                AuthEventType.LOGOUT, "success", user_id=session.user_id,
+                detail={"session_id": session.id}, **request_context(request),
+            )
+    response = Response(status_code=status.HTTP_204_NO_CONTENT)
     response.delete_cookie("refresh_token")
-    return Response(status_code=status.HTTP_204_NO_CONTENT)
+    return response
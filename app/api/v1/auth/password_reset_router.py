@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, status, HTTPException
+from fastapi import APIRouter, Depends, Request, status, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from datetime import datetime
@@ -7,10 +7,14 @@ from app.schemas.password_reset_schema import (
     PasswordResetRequestSchema,
     PasswordResetSchema,
     PasswordResetResponse,
+    PASSWORD_RESET_BODY,
 )
-from app.schemas.otp_schema import VerifyOtpSchema, OtpVerifyResponse
+from app.schemas.otp_schema import VerifyOtpSchema, OtpVerifyResponse, RESET_OTP_VERIFIED_BODY
+from app.core.responses import json_bytes_response
 from app.services.password_reset_service import request_password_reset, reset_password
 from app.db.models.password_reset_token import PasswordResetToken
+from app.db.models.enums_model import AuthEventType
+from app.services.audit_log import audit_log, request_context
 
 router = APIRouter(prefix="/api/v1", tags=["auth"])
 
@@ -18,15 +22,20 @@ router = APIRouter(prefix="/api/v1", tags=["auth"])
 @router.post("/request-password-reset", status_code=status.HTTP_204_NO_CONTENT)
 async def request_password_reset_endpoint(
     payload: PasswordResetRequestSchema,
+    request: Request,
     db: AsyncSession = Depends(get_db_session),
 ):
     await request_password_reset(payload.email, db)
+    await audit_log.record(
+        AuthEventType.PASSWORD_RESET_REQUEST, "requested", email=payload.email, **request_context(request)
+    )
     return 
 
 
 @router.post("/verify-password-reset-otp", response_model=OtpVerifyResponse)
 async def verify_password_reset_otp(
     payload: VerifyOtpSchema,
+    request: Request,
     db: AsyncSession = Depends(get_db_session),
 ):
     """Verify OTP for password reset"""
@@ -37,25 +46,42 @@ async def verify_password_reset_otp(
     )
     reset_token = result.scalar_one_or_none()
     
+    reason = None
     if not reset_token:
-        raise HTTPException(status_code=400, detail="Invalid OTP")
-    
-    if reset_token.used:
-        raise HTTPException(status_code=400, detail="OTP already used")
-    
-    if reset_token.expires_at < datetime.utcnow():
-        raise HTTPException(status_code=400, detail="OTP expired")
+        reason = "Invalid OTP"
+    elif reset_token.used:
+        reason = "OTP already used"
+    elif reset_token.expires_at < datetime.utcnow():
+        reason = "OTP expired"
+    if reason:
+        await audit_log.record(
+            AuthEventType.PASSWORD_RESET_OTP_VERIFICATION, "failure", email=payload.email,
+            detail={"reason": reason}, **request_context(request),
+        )
+        raise HTTPException(status_code=400, detail=reason)
+    await audit_log.record(
+        AuthEventType.PASSWORD_RESET_OTP_VERIFICATION, "success", user_id=reset_token.user_id,
+        email=payload.email, **request_context(request),
+    )
     
     # Don't mark as used yet - we'll do that when password is actually reset
-    return OtpVerifyResponse(message="OTP verified successfully. You can now reset your password.")
+    return json_bytes_response(RESET_OTP_VERIFIED_BODY)
 
 
 @router.post("/reset-password", response_model=PasswordResetResponse)
 async def reset_password_endpoint(
     payload: PasswordResetSchema,
+    request: Request,
     db: AsyncSession = Depends(get_db_session),
 ):
     if len(payload.new_password) < 8:
         raise HTTPException(status_code=400, detail="Password must be at least 8 characters.")
-    await reset_password(payload.token, payload.new_password, db)
-    return PasswordResetResponse(message="Password reset successful.")
+    try:
+        user_id = await reset_password(payload.token, payload.new_password, db)
+    except HTTPException as e:
+        await audit_log.record(
+            AuthEventType.PASSWORD_RESET, "failure", detail={"reason": e.detail}, **request_context(request)
+        )
+        raise
+    await audit_log.record(AuthEventType.PASSWORD_RESET, "success", user_id=user_id, **request_context(request))
+    return json_bytes_response(PASSWORD_RESET_BODY)
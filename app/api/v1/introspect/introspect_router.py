@@ -0,0 +1,19 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.database import get_db_session
+from app.core.responses import ORJSONResponse
+from app.schemas.introspect_schema import IntrospectRequest, IntrospectResponse
+from app.services.introspection_service import introspect_tokens
+
+router = APIRouter(prefix="/api/v1", tags=["auth"])
+
+
+@router.post("/introspect", response_model=IntrospectResponse, response_model_exclude_none=True)
+async def introspect(
+    payload: IntrospectRequest,
+    db: AsyncSession = Depends(get_db_session),
+):
+    """Batch token introspection (RFC 7662 semantics) for other backend services"""
+    results, max_age = await introspect_tokens(payload.tokens, payload.token_type_hint, db)
+    cache_control = f"private, max-age={max_age}" if max_age > 0 else "no-store"
+    return ORJSONResponse({"results": results}, headers={"Cache-Control": cache_control})
@@ -1,8 +1,11 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.database import get_db_session
-from app.schemas.otp_schema import VerifyOtpSchema, OtpVerifyResponse
+from app.schemas.otp_schema import VerifyOtpSchema, OtpVerifyResponse, EMAIL_VERIFIED_BODY
+from app.core.responses import json_bytes_response
 from app.services.otp_service import verify_otp_service
+from app.services.audit_log import audit_log, request_context
+from app.db.models.enums_model import AuthEventType
 
 router = APIRouter(prefix="/api/v1", tags=["otp"])
 
@@ -12,6 +15,18 @@ router = APIRouter(prefix="/api/v1", tags=["otp"])
 )
 async def verify_otp(
     payload: VerifyOtpSchema,
+    request: Request,
     db: AsyncSession = Depends(get_db_session),
 ):
-    return await verify_otp_service(payload, db)
+    try:
+        await verify_otp_service(payload, db)
+    except HTTPException as e:
+        await audit_log.record(
+            AuthEventType.OTP_VERIFICATION, "failure", email=payload.email,
+            detail={"reason": e.detail}, **request_context(request),
+        )
+        raise
+    await audit_log.record(
+        AuthEventType.OTP_VERIFICATION, "success", email=payload.email, **request_context(request)
+    )
+    return json_bytes_response(EMAIL_VERIFIED_BODY)
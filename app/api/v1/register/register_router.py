@@ -4,6 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.database import get_db_session
 from app.schemas.register_schema import RegisterSchema, RegisterResponse
 from app.services.register_service import register_user_service
+from app.core.responses import ORJSONResponse
 
 router = APIRouter(prefix="/api/v1", tags=["auth"])
 
@@ -21,4 +22,5 @@ async def register_user(
     User registration endpoint.
     Expects JSON body and x-api-key header.
     """
-    return await register_user_service(payload, db)
+    result = await register_user_service(payload, db)
+    return ORJSONResponse(result, status_code=status.HTTP_201_CREATED)
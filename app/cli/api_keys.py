@@ -0,0 +1,102 @@
+"""
+Manage per-client backend API keys.
+
+    uv run python -m app.cli.api_keys create --client billing --scopes auth,introspect [--rate-limit 600] [--expires-days 90]
+    uv run python -m app.cli.api_keys list
+    uv run python -m app.cli.api_keys revoke <key id>
+
+The plaintext key is printed once by `create`; only its SHA-256 digest is
+stored. To rotate without downtime, create a second key for the client,
+roll it out, then revoke the old one. Workers cache validated keys for
+API_KEY_CACHE_TTL seconds, so a revoked key can keep working that long.
+"""
+import argparse
+import asyncio
+import secrets
+import sys
+from datetime import datetime, timedelta
+
+from sqlalchemy import select, update
+
+from app.core.security import hash_api_key
+from app.db.database import AsyncSessionLocal, dispose_engine
+from app.db.models.api_key_model import ApiKey
+
+KEY_PREFIX = "ak_"
+
+
+async def create(args: argparse.Namespace) -> int:
+    key = KEY_PREFIX + secrets.token_urlsafe(32)
+    expires_at = datetime.utcnow() + timedelta(days=args.expires_days) if args.expires_days else None
+    api_key = ApiKey(
+        client_name=args.client,
+        key_prefix=key[: len(KEY_PREFIX) + 8],
+        key_hash=hash_api_key(key),
+        scopes=[s.strip() for s in args.scopes.split(",") if s.strip()],
+        rate_limit_per_minute=args.rate_limit,
+        expires_at=expires_at,
+    )
+    async with AsyncSessionLocal() as db:
+        db.add(api_key)
+        await db.commit()
+    print(f"id:     {api_key.id}\nclient: {api_key.client_name}\nscopes: {','.join(api_key.scopes)}")
+    print(f"key:    {key}\n\nStore the key now; it cannot be shown again.")
+    return 0
+
+
+async def list_keys(args: argparse.Namespace) -> int:
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(select(ApiKey).order_by(ApiKey.client_name, ApiKey.created_at))
+        keys = result.scalars().all()
+    print(f"{'id':36s} {'client':20s} {'prefix':12s} {'scopes':24s} {'rpm':>6s} {'active':6s} expires")
+    for k in keys:
+        rpm = str(k.rate_limit_per_minute) if k.rate_limit_per_minute is not None else "-"
+        expires = k.expires_at.isoformat(timespec="minutes") if k.expires_at else "-"
+        print(f"{k.id!s:36s} {k.client_name:20s} {k.key_prefix:12s} {','.join(k.scopes):24s} {rpm:>6s} {str(k.is_active):6s} {expires}")
+    return 0
+
+
+async def revoke(args: argparse.Namespace) -> int:
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            update(ApiKey).where(ApiKey.id == args.key_id).values(is_active=False).returning(ApiKey.id)
+        )
+        revoked = result.scalar_one_or_none()
+        await db.commit()
+    if revoked is None:
+        print(f"No API key with id {args.key_id}")
+        return 1
+    print(f"Revoked {revoked}")
+    return 0
+
+
+async def run(args: argparse.Namespace) -> int:
+    try:
+        return await args.handler(args)
+    finally:
+        await dispose_engine()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    create_cmd = commands.add_parser("create", help="issue a new key")
+    create_cmd.add_argument("--client", required=True, help="client name used in metrics and logs")
+    create_cmd.add_argument("--scopes", default="auth", help="comma-separated scopes, or * for all but admin (default: auth)")
+    create_cmd.add_argument("--rate-limit", type=int, default=None, help="requests per minute; unlimited if omitted")
+    create_cmd.add_argument("--expires-days", type=int, default=None, help="expire the key after this many days")
+    create_cmd.set_defaults(handler=create)
+
+    list_cmd = commands.add_parser("list", help="show all keys")
+    list_cmd.set_defaults(handler=list_keys)
+
+    revoke_cmd = commands.add_parser("revoke", help="deactivate a key")
+    revoke_cmd.add_argument("key_id")
+    revoke_cmd.set_defaults(handler=revoke)
+
+    return asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""
+Partition maintenance for the range-partitioned tables (session, otp, auth_event).
+
+    uv run python -m app.cli.partitions [--table session] [--shard NAME] [--dry-run]
+
+For each table, creates the partitions for the coming periods (see
+PARTITIONED_TABLES in app.db.partitions) and drops partitions whose whole
+range is past retention. For session and otp that is every partition whose
+expiry range has ended. Dropping a partition is O(1) and leaves no dead
+tuples behind, unlike DELETE. Also reports rows that landed in a DEFAULT
+partition, which means maintenance has fallen behind. Run it daily, e.g.
+from cron or a Kubernetes CronJob; it is idempotent. With DATABASE_SHARDS set, every
+shard is maintained unless --shard is given.
+"""
+import argparse
+import asyncio
+import sys
+from typing import List
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.db.database import all_engines, dispose_engine, shard_map
+from app.db.partitions import PARTITIONED_TABLES, PartitionScheme, ensure_partitions, expired_partitions, list_partitions
+
+
+async def maintain(engine: AsyncEngine, label: str, scheme: PartitionScheme, dry_run: bool) -> None:
+    # One short transaction per DDL statement, so parent-table locks are held briefly
+    if dry_run:
+        async with engine.connect() as conn:
+            partitions = await list_partitions(conn, scheme.table)
+        print(f"{label}{scheme.table}: {len(partitions)} partitions")
+    else:
+        async with engine.begin() as conn:
+            created = await ensure_partitions(conn, scheme)
+        print(f"{label}{scheme.table}: created {', '.join(created) if created else 'nothing'}")
+        async with engine.connect() as conn:
+            partitions = await list_partitions(conn, scheme.table)
+
+    for name in expired_partitions(partitions, scheme):
+        if dry_run:
+            print(f"{label}{scheme.table}: would drop {name}")
+            continue
+        async with engine.begin() as conn:
+            await conn.execute(text(f'DROP TABLE "{name}"'))
+        print(f"{label}{scheme.table}: dropped {name}")
+
+    for name, upper in partitions:
+        if upper is None:
+            async with engine.connect() as conn:
+                rows = await conn.scalar(text(f'SELECT count(*) FROM "{name}"'))
+            if rows:
+                print(f"{label}{scheme.table}: WARNING {rows} rows in default partition {name}")
+
+
+async def run(tables: List[str], shards: List[str], dry_run: bool) -> int:
+    try:
+        for shard in shards:
+            label = f"[{shard}] " if shard_map.sharded else ""
+            for table in tables:
+                await maintain(all_engines()[shard], label, PARTITIONED_TABLES[table], dry_run)
+    finally:
+        await dispose_engine()
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--table", action="append", choices=sorted(PARTITIONED_TABLES), help="limit to this table (repeatable)"
+    )
+    parser.add_argument(
+        "--shard", action="append", choices=sorted(all_engines()), help="limit to this shard (repeatable)"
+    )
+    parser.add_argument("--dry-run", action="store_true", help="show what would be dropped without changing anything")
+    args = parser.parse_args()
+    return asyncio.run(run(args.table or list(PARTITIONED_TABLES), args.shard or sorted(all_engines()), args.dry_run))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,164 @@
+"""
+Move users onto the shard the hash ring assigns them, online.
+
+    uv run python -m app.cli.reshard plan
+    uv run python -m app.cli.reshard move [--batch-size 500] [--limit N]
+
+Adding a shard:
+  1. Create the database, then run `alembic -x shard=<name> upgrade head`
+     and `python -m app.cli.partitions --shard <name>` against it.
+  2. Deploy with the new shard in DATABASE_SHARDS and the previous shard
+     names in DATABASE_SHARDS_PREVIOUS. Users whose new shard doesn't have
+     them yet keep being served from their old one.
+  3. Run `move` until `plan` reports nothing to move, then deploy again
+     without DATABASE_SHARDS_PREVIOUS.
+
+Each user is moved in its own step: the user row is locked on the source,
+the user and their onboarding, otp, session and password_reset_token rows
+are copied to the target and committed there, then deleted from the
+source. An interrupted run is safe to repeat; rows already on the target
+are skipped.
+
+Races with live traffic:
+  - The app looks for a user on their new shard before the old one, so
+    requests routed after the copy is committed find them there. Reads on
+    the source don't wait on the lock: one routed there just before the
+    delete can miss the user (a login gets 401) and succeeds on retry.
+  - A write referencing the user on the source (a login's session, an OTP)
+    waits on the lock, then fails its foreign key once the user is deleted.
+    The app answers it with 503 and Retry-After; the retry goes to the new
+    shard. Tokens issued on the old shard keep working: logout and
+    introspection follow their user to the new one.
+  - A registration for an email already on the source whose insert is
+    blocked behind the move succeeds once the user is deleted there,
+    leaving a second user with that email on the old shard. `move` reports
+    these as conflicts (exit status 1) instead of moving them; delete
+    whichever user is the duplicate, then run `move` again.
+"""
+import argparse
+import asyncio
+import sys
+from collections import Counter
+from typing import AsyncIterator, Optional, Tuple
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.db.database import dispose_engine, shard_map
+from app.db.models.onboarding_model import OnBoarding
+from app.db.models.otp_model import Otp
+from app.db.models.password_reset_token import PasswordResetToken
+from app.db.models.session_model import Session
+from app.db.models.user_model import User
+from app.utils.email_normalization import normalize_email
+
+USER = User.__table__
+CHILD_TABLES = [t.__table__ for t in (OnBoarding, Otp, Session, PasswordResetToken)]
+
+
+async def misplaced_users(shard: str, batch_size: int) -> AsyncIterator[Tuple[str, str]]:
+    """(user id, target shard) for every user on `shard` the ring places elsewhere."""
+    last_id: Optional[str] = None
+    while True:
+        query = select(USER.c.id, USER.c.email).order_by(USER.c.id).limit(batch_size)
+        if last_id is not None:
+            query = query.where(USER.c.id > last_id)
+        async with shard_map.engines[shard].connect() as conn:
+            rows = (await conn.execute(query)).all()
+        if not rows:
+            return
+        for user_id, email in rows:
+            target = shard_map.owner(normalize_email(email))
+            if target != shard:
+                yield user_id, target
+        last_id = rows[-1].id
+
+
+class EmailConflict(Exception):
+    pass
+
+
+async def move_user(source: AsyncEngine, target: AsyncEngine, user_id: str) -> bool:
+    async with source.begin() as src:
+        user = (
+            await src.execute(select(USER).where(USER.c.id == user_id).with_for_update())
+        ).mappings().one_or_none()
+        if user is None:
+            return False  # deleted, or moved by a concurrent run
+        children = {
+            table: (await src.execute(select(table).where(table.c.user_id == user_id))).mappings().all()
+            for table in CHILD_TABLES
+        }
+        async with target.begin() as dst:
+            await dst.execute(pg_insert(USER).values(dict(user)).on_conflict_do_nothing())
+            if await dst.scalar(select(USER.c.id).where(USER.c.id == user_id)) is None:
+                raise EmailConflict(f"user {user_id}: email already taken by another user on the target shard")
+            for table, rows in children.items():
+                if rows:
+                    await dst.execute(pg_insert(table).values([dict(r) for r in rows]).on_conflict_do_nothing())
+        # Committed on the target, so requests now find the user there; children cascade
+        await src.execute(delete(USER).where(USER.c.id == user_id))
+    return True
+
+
+async def plan(args: argparse.Namespace) -> int:
+    moves: Counter = Counter()
+    for shard in sorted(shard_map.engines):
+        async for _, target in misplaced_users(shard, args.batch_size):
+            moves[(shard, target)] += 1
+    if not moves:
+        print("Every user is on its shard")
+    for (source, target), count in sorted(moves.items()):
+        print(f"{source} -> {target}: {count} users")
+    return 0
+
+
+async def move(args: argparse.Namespace) -> int:
+    moved = conflicts = 0
+    for shard in sorted(shard_map.engines):
+        async for user_id, target in misplaced_users(shard, args.batch_size):
+            if args.limit is not None and moved >= args.limit:
+                print(f"Stopped after {moved} users (--limit)")
+                return 1 if conflicts else 0
+            try:
+                if await move_user(shard_map.engines[shard], shard_map.engines[target], user_id):
+                    moved += 1
+                    if moved % 100 == 0:
+                        print(f"Moved {moved} users")
+            except EmailConflict as e:
+                conflicts += 1
+                print(f"Conflict: {e} ({shard} -> {target})", file=sys.stderr)
+    print(f"Moved {moved} users, {conflicts} conflicts")
+    return 1 if conflicts else 0
+
+
+async def run(args: argparse.Namespace) -> int:
+    try:
+        return await args.handler(args)
+    finally:
+        await dispose_engine()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    plan_cmd = commands.add_parser("plan", help="count users per source -> target shard")
+    plan_cmd.add_argument("--batch-size", type=int, default=1000, help="users scanned per query")
+    plan_cmd.set_defaults(handler=plan)
+
+    move_cmd = commands.add_parser("move", help="move misplaced users to their shard")
+    move_cmd.add_argument("--batch-size", type=int, default=500, help="users scanned per query")
+    move_cmd.add_argument("--limit", type=int, default=None, help="stop after moving this many users")
+    move_cmd.set_defaults(handler=move)
+
+    args = parser.parse_args()
+    if not shard_map.sharded:
+        print("DATABASE_SHARDS is not configured; nothing to reshard", file=sys.stderr)
+        return 1
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
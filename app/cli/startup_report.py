@@ -0,0 +1,78 @@
+"""
+Startup budget report: how long a fresh worker spends importing the app.
+
+    uv run python -m app.cli.startup_report [--top 20] [--runs 3] [--budget-ms 900]
+
+Runs `python -X importtime -c "import app.main"` in clean subprocesses and
+prints the total import time plus the slowest packages by self time and the
+slowest individual modules by cumulative time. With --budget-ms the command
+exits non-zero when the fastest run exceeds the budget, so CI can catch
+import-time regressions.
+"""
+import argparse
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+TARGET = "app.main"
+LINE_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def measure_once(target: str) -> List[Tuple[int, int, int, str]]:
+    """Return (self_us, cumulative_us, depth, module) rows for one cold import."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        sys.stderr.write(proc.stderr)
+        raise SystemExit(f"Importing {target} failed")
+    rows = []
+    for line in proc.stderr.splitlines():
+        match = LINE_RE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            rows.append((int(self_us), int(cumulative_us), len(indent) // 2, module))
+    return rows
+
+
+def summarize(rows: List[Tuple[int, int, int, str]]) -> Tuple[int, Dict[str, int]]:
+    total = sum(self_us for self_us, _, _, _ in rows)
+    by_package: Dict[str, int] = defaultdict(int)
+    for self_us, _, _, module in rows:
+        by_package[module.split(".")[0]] += self_us
+    return total, by_package
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target", default=TARGET, help="module to import (default: app.main)")
+    parser.add_argument("--runs", type=int, default=3, help="cold imports to run; the fastest is reported")
+    parser.add_argument("--top", type=int, default=20, help="rows to show per table")
+    parser.add_argument("--budget-ms", type=float, default=None, help="fail if the import takes longer than this")
+    args = parser.parse_args()
+
+    runs = [measure_once(args.target) for _ in range(max(1, args.runs))]
+    rows = min(runs, key=lambda r: summarize(r)[0])
+    total, by_package = summarize(rows)
+
+    print(f"Import of {args.target}: {total / 1000:.1f} ms (fastest of {len(runs)} runs, {len(rows)} modules)\n")
+    print(f"{'package':40s} {'self ms':>9s} {'share':>7s}")
+    for package, self_us in sorted(by_package.items(), key=lambda kv: kv[1], reverse=True)[: args.top]:
+        print(f"{package:40s} {self_us / 1000:9.1f} {self_us / total:7.1%}")
+
+    print(f"\n{'module':60s} {'cumulative ms':>14s}")
+    for _, cumulative_us, _, module in sorted(rows, key=lambda r: r[1], reverse=True)[: args.top]:
+        print(f"{module:60s} {cumulative_us / 1000:14.1f}")
+
+    if args.budget_ms is not None and total / 1000 > args.budget_ms:
+        print(f"\nFAIL: import took {total / 1000:.1f} ms, budget is {args.budget_ms:.1f} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,20 +1,93 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import AnyUrl, Field
+from typing import Dict, List, Optional
 
 
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
     DATABASE_URL: AnyUrl
+    DATABASE_SHARDS: Dict[str, str] = Field(default={}, env="DATABASE_SHARDS")  # type: ignore  # shard name -> URL
+    DATABASE_SHARDS_PREVIOUS: List[str] = Field(default=[], env="DATABASE_SHARDS_PREVIOUS")  # type: ignore  # ring before an in-progress reshard
+    ENVIRONMENT: str = Field(default="development", env="ENVIRONMENT")  # type: ignore  # development | staging | production
     DB_ECHO: bool = Field(default=False, env="DB_ECHO")  # type: ignore
-    BACKEND_API_KEY: str = Field(..., env="BACKEND_API_KEY")  # type: ignore
+    LOG_LEVEL: str = Field(default="INFO", env="LOG_LEVEL")  # type: ignore
+    LOG_FORMAT: str = Field(default="json", env="LOG_FORMAT")  # type: ignore  # json | text
+    LOG_QUEUE_SIZE: int = Field(default=10000, env="LOG_QUEUE_SIZE")  # type: ignore
+    LOG_SAMPLE_RATES: Dict[str, float] = Field(default={}, env="LOG_SAMPLE_RATES")  # type: ignore  # path -> share of INFO records kept
+    SERVER_TIMING_ENABLED: bool = Field(default=False, env="SERVER_TIMING_ENABLED")  # type: ignore  # leaks statement counts; dev only
+    SLOW_QUERY_THRESHOLD_MS: float = Field(default=200.0, env="SLOW_QUERY_THRESHOLD_MS")  # type: ignore  # 0 disables
+    DB_POOL_SIZE: int = Field(default=5, env="DB_POOL_SIZE")  # type: ignore
+    DB_MAX_OVERFLOW: int = Field(default=10, env="DB_MAX_OVERFLOW")  # type: ignore
+    DB_POOL_RECYCLE: int = Field(default=1800, env="DB_POOL_RECYCLE")  # type: ignore
+    DB_POOL_WARM_CONNECTIONS: int = Field(default=2, env="DB_POOL_WARM_CONNECTIONS")  # type: ignore
+    REDIS_URL: Optional[str] = Field(default=None, env="REDIS_URL")  # type: ignore
+    BACKEND_API_KEY: Optional[str] = Field(default=None, env="BACKEND_API_KEY")  # type: ignore  # shared legacy key
+    API_KEY_CACHE_TTL: float = Field(default=60.0, env="API_KEY_CACHE_TTL")  # type: ignore
+    API_KEY_NEGATIVE_CACHE_TTL: float = Field(default=5.0, env="API_KEY_NEGATIVE_CACHE_TTL")  # type: ignore
+    API_KEY_LOOKUP_RATE_LIMIT: int = Field(default=30, env="API_KEY_LOOKUP_RATE_LIMIT")  # type: ignore  # uncached key lookups per source IP per minute
+    CREDENTIAL_CACHE_ENABLED: bool = Field(default=False, env="CREDENTIAL_CACHE_ENABLED")  # type: ignore
+    CREDENTIAL_CACHE_TTL: float = Field(default=60.0, env="CREDENTIAL_CACHE_TTL")  # type: ignore
+    CREDENTIAL_CACHE_SIZE: int = Field(default=10000, env="CREDENTIAL_CACHE_SIZE")  # type: ignore
     RESEND_API_KEY: str = Field(..., env="RESEND_API_KEY")  # type: ignore
     RESEND_FROM_EMAIL: str = Field(..., env="RESEND_FROM_EMAIL")  # type: ignore
+    RESEND_API_URL: str = Field(default="https://api.resend.com", env="RESEND_API_URL")  # type: ignore
+    EMAIL_TRANSPORT: str = Field(default="resend", env="EMAIL_TRANSPORT")  # type: ignore  # resend | smtp
+    EMAIL_TIMEOUT: float = Field(default=10.0, env="EMAIL_TIMEOUT")  # type: ignore
+    EMAIL_HTTP2: bool = Field(default=True, env="EMAIL_HTTP2")  # type: ignore
+    EMAIL_MAX_CONNECTIONS: int = Field(default=20, env="EMAIL_MAX_CONNECTIONS")  # type: ignore
+    EMAIL_SECONDARY_TRANSPORT: Optional[str] = Field(default=None, env="EMAIL_SECONDARY_TRANSPORT")  # type: ignore
+    EMAIL_HEDGE_DELAY: Optional[float] = Field(default=None, env="EMAIL_HEDGE_DELAY")  # type: ignore  # seconds; unset disables hedging
+    EMAIL_BREAKER_FAILURE_THRESHOLD: int = Field(default=5, env="EMAIL_BREAKER_FAILURE_THRESHOLD")  # type: ignore
+    EMAIL_BREAKER_SLOW_CALL_SECONDS: float = Field(default=3.0, env="EMAIL_BREAKER_SLOW_CALL_SECONDS")  # type: ignore
+    EMAIL_BREAKER_RESET_TIMEOUT: float = Field(default=30.0, env="EMAIL_BREAKER_RESET_TIMEOUT")  # type: ignore
+    EMAIL_DEFER_QUEUE_SIZE: int = Field(default=1000, env="EMAIL_DEFER_QUEUE_SIZE")  # type: ignore  # 0 disables deferral
+    EMAIL_DEFER_MAX_ATTEMPTS: int = Field(default=5, env="EMAIL_DEFER_MAX_ATTEMPTS")  # type: ignore
+    SMTP_HOST: str = Field(default="localhost", env="SMTP_HOST")  # type: ignore
+    SMTP_PORT: int = Field(default=1025, env="SMTP_PORT")  # type: ignore
+    SMTP_USERNAME: Optional[str] = Field(default=None, env="SMTP_USERNAME")  # type: ignore
+    SMTP_PASSWORD: Optional[str] = Field(default=None, env="SMTP_PASSWORD")  # type: ignore
+    SMTP_START_TLS: bool = Field(default=False, env="SMTP_START_TLS")  # type: ignore
     JWT_ACCESS_TOKEN_SECRET: str = Field(..., env="JWT_ACCESS_TOKEN_SECRET")  # type: ignore
     JWT_ACCESS_TOKEN_EXPIRATION: str = Field(default="30m", env="JWT_ACCESS_TOKEN_EXPIRATION")  # type: ignore
     JWT_REFRESH_TOKEN_SECRET: str = Field(..., env="JWT_REFRESH_TOKEN_SECRET")  # type: ignore
     JWT_REFRESH_TOKEN_EXPIRATION: str = Field(default="7d", env="JWT_REFRESH_TOKEN_EXPIRATION")  # type: ignore
+    AUDIT_QUEUE_SIZE: int = Field(default=10000, env="AUDIT_QUEUE_SIZE")  # type: ignore  # 0 disables the audit log
+    AUDIT_BATCH_SIZE: int = Field(default=500, env="AUDIT_BATCH_SIZE")  # type: ignore
+    AUDIT_FLUSH_INTERVAL: float = Field(default=1.0, env="AUDIT_FLUSH_INTERVAL")  # type: ignore
+    AUDIT_OVERFLOW_POLICY: str = Field(default="drop", env="AUDIT_OVERFLOW_POLICY")  # type: ignore  # drop | block
+    AUDIT_RETENTION_DAYS: int = Field(default=0, env="AUDIT_RETENTION_DAYS")  # type: ignore  # 0 keeps audit events forever
+    INTROSPECT_CACHE_MAX_AGE: int = Field(default=30, env="INTROSPECT_CACHE_MAX_AGE")  # type: ignore  # seconds
+    OTP_RESEND_COOLDOWN_SECONDS: int = Field(default=60, env="OTP_RESEND_COOLDOWN_SECONDS")  # type: ignore
+    ID_STRATEGY: str = Field(default="uuid7", env="ID_STRATEGY")  # type: ignore  # uuid7 | uuid4
+    DISPOSABLE_DOMAINS_FILE: Optional[str] = Field(default=None, env="DISPOSABLE_DOMAINS_FILE")  # type: ignore
+    DISPOSABLE_DOMAINS_RELOAD_INTERVAL: float = Field(default=30.0, env="DISPOSABLE_DOMAINS_RELOAD_INTERVAL")  # type: ignore
+    SERVER_HOST: str = Field(default="0.0.0.0", env="SERVER_HOST")  # type: ignore
+    SERVER_PORT: int = Field(default=8009, env="SERVER_PORT")  # type: ignore
+    SERVER_WORKERS: int = Field(default=1, env="SERVER_WORKERS")  # type: ignore
+    SERVER_KEEP_ALIVE: int = Field(default=5, env="SERVER_KEEP_ALIVE")  # type: ignore
+    SERVER_BACKLOG: int = Field(default=2048, env="SERVER_BACKLOG")  # type: ignore
+    SERVER_LOOP: str = Field(default="auto", env="SERVER_LOOP")  # type: ignore  # auto | uvloop | asyncio
+    SERVER_HTTP: str = Field(default="auto", env="SERVER_HTTP")  # type: ignore  # auto | httptools | h11
+    SERVER_GRACEFUL_SHUTDOWN_TIMEOUT: int = Field(default=30, env="SERVER_GRACEFUL_SHUTDOWN_TIMEOUT")  # type: ignore
+    SERVER_PROXY_HEADERS: bool = Field(default=True, env="SERVER_PROXY_HEADERS")  # type: ignore
+    SERVER_FORWARDED_ALLOW_IPS: str = Field(default="127.0.0.1", env="SERVER_FORWARDED_ALLOW_IPS")  # type: ignore  # comma-separated proxy IPs/CIDRs
+    LOAD_SHEDDING_ENABLED: bool = Field(default=True, env="LOAD_SHEDDING_ENABLED")  # type: ignore
+    CONCURRENCY_INITIAL_LIMIT: int = Field(default=32, env="CONCURRENCY_INITIAL_LIMIT")  # type: ignore
+    CONCURRENCY_MIN_LIMIT: int = Field(default=4, env="CONCURRENCY_MIN_LIMIT")  # type: ignore
+    CONCURRENCY_MAX_LIMIT: int = Field(default=256, env="CONCURRENCY_MAX_LIMIT")  # type: ignore
+    CONCURRENCY_LATENCY_TOLERANCE: float = Field(default=2.0, env="CONCURRENCY_LATENCY_TOLERANCE")  # type: ignore
+    LOOP_WATCHDOG_ENABLED: bool = Field(default=False, env="LOOP_WATCHDOG_ENABLED")  # type: ignore
+    LOOP_WATCHDOG_INTERVAL: float = Field(default=0.05, env="LOOP_WATCHDOG_INTERVAL")  # type: ignore
+    LOOP_WATCHDOG_THRESHOLD: float = Field(default=0.1, env="LOOP_WATCHDOG_THRESHOLD")  # type: ignore
+    HEALTH_PROBE_INTERVAL: float = Field(default=5.0, env="HEALTH_PROBE_INTERVAL")  # type: ignore
+    HEALTH_PROBE_TIMEOUT: float = Field(default=2.0, env="HEALTH_PROBE_TIMEOUT")  # type: ignore
+    BLOCKING_EXECUTOR_WORKERS: int = Field(default=8, env="BLOCKING_EXECUTOR_WORKERS")  # type: ignore
     # FRONTEND_URL: str = Field(..., env="FRONTEND_URL")  # URL for password reset link
 
+    @property
+    def is_production(self) -> bool:
+        return self.ENVIRONMENT.lower() == "production"
+
     @property
     def async_db_uri(self) -> str:
         return str(self.DATABASE_URL)
@@ -0,0 +1,147 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.metrics import Gauge, Histogram
+from app.core.redis_client import get_redis
+from app.db.database import all_engines
+from app.services.email_transport import get_email_transport
+from app.utils.circuit_breaker import CircuitState
+
+DEPENDENCY_UP = Gauge("dependency_up", "1 if the last health check of a dependency passed", ["dependency"])
+DEPENDENCY_CHECK_SECONDS = Histogram(
+    "dependency_check_seconds", "Latency of background dependency health checks", ["dependency"]
+)
+
+
+class SkipCheck(Exception):
+    """Raised by a check whose dependency is not configured."""
+
+
+@dataclass(frozen=True)
+class DependencyCheck:
+    name: str
+    check: Callable[[], Awaitable[Optional[Dict[str, Any]]]]
+    # Readiness fails only when a required dependency is down; optional ones
+    # have fallbacks and are reported as degraded.
+    required: bool = True
+
+
+async def check_database() -> None:
+    async def ping(shard_engine) -> None:
+        async with shard_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    # Every shard is required: a user on a down shard can't log in
+    await asyncio.gather(*(ping(e) for e in all_engines().values()))
+
+
+async def check_redis() -> None:
+    redis = get_redis()
+    if redis is None:
+        raise SkipCheck("REDIS_URL not configured")
+    await redis.ping()
+
+
+async def check_email() -> Dict[str, Any]:
+    # Circuit state only: probing the provider every few seconds from every
+    # worker would cost more than it tells us
+    states = get_email_transport().circuit_states()
+    if all(state == CircuitState.OPEN for state in states.values()):
+        raise RuntimeError(f"all email circuits open: {', '.join(states)}")
+    return {"circuits": {name: state.name.lower() for name, state in states.items()}}
+
+
+DEFAULT_CHECKS = (
+    DependencyCheck("database", check_database, required=True),
+    DependencyCheck("redis", check_redis, required=False),
+    DependencyCheck("email", check_email, required=False),
+)
+
+
+class HealthProber:
+    """
+    Checks dependencies on a background task every `interval` seconds and
+    keeps the last result, so /readyz answers from memory no matter how often
+    it is probed. Results older than `stale_after` count as not ready (the
+    prober itself is stuck), and the prober reports not ready once stopped,
+    so a draining worker is taken out of rotation.
+    """
+
+    def __init__(self, checks=DEFAULT_CHECKS, interval: float = 5.0, timeout: float = 2.0):
+        self.checks = checks
+        self.interval = interval
+        self.timeout = timeout
+        self.stale_after = 3 * interval
+        self._results: Dict[str, Dict[str, Any]] = {}
+        self._checked_at: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def _run_check(self, dependency: DependencyCheck) -> Dict[str, Any]:
+        start = time.perf_counter()
+        try:
+            detail = await asyncio.wait_for(dependency.check(), self.timeout)
+            result: Dict[str, Any] = {"status": "ok", **(detail or {})}
+        except SkipCheck as e:
+            return {"status": "skipped", "reason": str(e)}
+        except asyncio.TimeoutError:
+            result = {"status": "error", "error": f"timed out after {self.timeout}s"}
+        except Exception as e:
+            result = {"status": "error", "error": repr(e)}
+        elapsed = time.perf_counter() - start
+        result["latency_ms"] = round(elapsed * 1000, 2)
+        DEPENDENCY_CHECK_SECONDS.observe(elapsed, dependency=dependency.name)
+        DEPENDENCY_UP.set(1 if result["status"] == "ok" else 0, dependency=dependency.name)
+        return result
+
+    async def probe(self) -> None:
+        results = await asyncio.gather(*(self._run_check(c) for c in self.checks))
+        for dependency, result in zip(self.checks, results):
+            previous = self._results.get(dependency.name, {}).get("status")
+            if previous is not None and previous != result["status"]:
+                logging.warning("Dependency %s is now %s: %s", dependency.name, result['status'], result.get('error', ''))
+            self._results[dependency.name] = result
+        self._checked_at = time.monotonic()
+
+    async def _run(self) -> None:
+        while True:
+            await self.probe()
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="health-prober")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._checked_at = None
+
+    def readiness(self) -> Dict[str, Any]:
+        """Last probe result, shaped for the /readyz body."""
+        if self._checked_at is None:
+            return {"status": "not_ready", "reason": "no completed health check", "checks": self._results}
+        age = time.monotonic() - self._checked_at
+        if age > self.stale_after:
+            return {"status": "not_ready", "reason": f"last check {age:.0f}s ago", "checks": self._results}
+        status = "ready"
+        for dependency in self.checks:
+            if self._results[dependency.name]["status"] == "error":
+                if dependency.required:
+                    status = "not_ready"
+                    break
+                status = "degraded"
+        return {"status": status, "checked_ago_s": round(age, 2), "checks": self._results}
+
+
+health_prober = HealthProber(interval=settings.HEALTH_PROBE_INTERVAL, timeout=settings.HEALTH_PROBE_TIMEOUT)
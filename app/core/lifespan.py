@@ -0,0 +1,58 @@
+import logging
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+
+from app.core.config import settings
+from app.core.logging_config import configure_logging, shutdown_logging
+from app.core.executors import start_executor, shutdown_executor
+from app.db.database import warm_db_pool, dispose_engine
+from app.services.email_transport import get_email_transport, close_email_transport
+from app.services.email_queue import deferred_emails
+from app.core.redis_client import close_redis
+from app.db.notifications import notification_listener
+from app.services.audit_log import audit_log
+from app.core.health import health_prober
+from app.core.loop_watchdog import loop_watchdog
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Per-worker startup and shutdown.
+    Startup first routes logging through the queue-backed writer thread and
+    starts the optional event-loop watchdog, then creates the
+    blocking-call executor, the email transport and its connection pool plus
+    the deferred-email retry task, starts the Postgres notification listener
+    (token revocations, cache invalidations) and the audit writer, warms the
+    DB pool and then starts the health prober behind /readyz.
+    Shutdown runs after uvicorn has drained in-flight requests; it waits for
+    queued executor work, flushes pending audit events, then closes the email,
+    Redis and DB connection pools and flushes the log queue.
+    """
+    configure_logging()
+    if settings.LOOP_WATCHDOG_ENABLED:
+        loop_watchdog.start()
+    start_executor(settings.BLOCKING_EXECUTOR_WORKERS)
+    get_email_transport()
+    deferred_emails.start()
+    notification_listener.start()
+    audit_log.start()
+    if settings.DB_POOL_WARM_CONNECTIONS > 0:
+        await warm_db_pool(settings.DB_POOL_WARM_CONNECTIONS)
+    health_prober.start()
+    logging.info("Worker startup complete")
+    try:
+        yield
+    finally:
+        await health_prober.stop()
+        shutdown_executor(wait=True)
+        await deferred_emails.stop()
+        await notification_listener.stop()
+        await audit_log.stop()
+        await close_email_transport()
+        await close_redis()
+        await dispose_engine()
+        await loop_watchdog.stop()
+        logging.info("Worker shutdown complete")
+        shutdown_logging()
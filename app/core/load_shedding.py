@@ -0,0 +1,179 @@
+import enum
+import time
+from typing import Dict, Mapping
+
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.metrics import Counter, Gauge
+from app.core.responses import prebuilt_json
+
+INFLIGHT_REQUESTS = Gauge("http_inflight_requests", "Requests currently admitted by the concurrency limiter")
+CONCURRENCY_LIMIT = Gauge("http_concurrency_limit", "Current adaptive concurrency limit")
+REQUESTS_SHED = Counter("http_requests_shed_total", "Requests rejected with 503 by the concurrency limiter", ["priority", "route"])
+
+
+class Priority(enum.IntEnum):
+    LOW = 0
+    NORMAL = 1
+    HIGH = 2
+    CRITICAL = 3  # never limited (probes, metrics)
+
+
+# Share of the current limit each class may fill. Once in-flight requests
+# pass a class's share, new requests of that class are shed, so expensive
+# work goes first and cheap requests keep flowing.
+PRIORITY_SHARE = {Priority.LOW: 0.6, Priority.NORMAL: 0.85, Priority.HIGH: 1.0}
+
+ROUTE_PRIORITIES: Dict[str, Priority] = {
+    "/livez": Priority.CRITICAL,
+    "/readyz": Priority.CRITICAL,
+    "/health": Priority.CRITICAL,
+    "/metrics": Priority.CRITICAL,
+    # Needed most when the worker is overloaded
+    "/api/v1/admin/profile": Priority.CRITICAL,
+    # Cheap, and shedding them would strand users mid-flow
+    "/api/v1/logout": Priority.HIGH,
+    "/api/v1/introspect": Priority.HIGH,
+    "/api/v1/verify-otp": Priority.HIGH,
+    "/api/v1/verify-password-reset-otp": Priority.HIGH,
+    # Argon2 hashing or an outgoing email per request
+    "/api/v1/login": Priority.LOW,
+    "/api/v1/register": Priority.LOW,
+    "/api/v1/reset-password": Priority.LOW,
+    "/api/v1/request-password-reset": Priority.LOW,
+    "/api/v1/resend-email-verification-otp": Priority.LOW,
+    "/api/v1/resend-password-reset-otp": Priority.LOW,
+}
+
+SHED_BODY = prebuilt_json({"detail": "Server is overloaded, retry later"})
+
+
+class AdaptiveLimiter:
+    """
+    AIMD concurrency limit driven by latency. Each route keeps two EWMAs of
+    its successful (2xx) latencies: a short one tracking the last few
+    requests, and a long baseline fed only while the worker is not
+    saturated, so it reflects unloaded latency. Averages rather than
+    minimums, because one route mixes fast rejections (unknown email, 422)
+    with slow Argon2 work.
+
+    The limit is only cut while in-flight requests are near it (an idle
+    worker is not overloaded, however slow a request was): when a route's
+    short average exceeds `tolerance` x its baseline, or on a 5xx, by
+    `backoff` at most once per `decrease_interval`. It grows by about one
+    per limit's worth of completions while saturated and healthy, and
+    below the initial limit it also recovers while idle.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        min_limit: int,
+        max_limit: int,
+        tolerance: float = 2.0,
+        backoff: float = 0.9,
+        decrease_interval: float = 0.25,
+    ):
+        self.limit = float(initial)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.tolerance = tolerance
+        self.backoff = backoff
+        self.decrease_interval = decrease_interval
+        self.initial = float(initial)
+        self.inflight = 0
+        self._baselines: Dict[str, float] = {}
+        self._recent: Dict[str, float] = {}
+        self._last_decrease = 0.0
+        CONCURRENCY_LIMIT.set(self.limit)
+
+    def try_acquire(self, priority: Priority) -> bool:
+        if self.inflight >= self.limit * PRIORITY_SHARE[priority]:
+            return False
+        self.inflight += 1
+        INFLIGHT_REQUESTS.set(self.inflight)
+        return True
+
+    def release(self, route: str, latency: float, status_code: int) -> None:
+        # Near the limit: LOW traffic alone is capped at its 0.6 share
+        saturated = self.inflight >= self.limit * 0.5
+        self.inflight -= 1
+        INFLIGHT_REQUESTS.set(self.inflight)
+
+        congested = status_code >= 500
+        if 200 <= status_code < 300:
+            recent = self._recent.get(route, latency)
+            recent += (latency - recent) * 0.2
+            self._recent[route] = recent
+            baseline = self._baselines.get(route)
+            if baseline is None:
+                baseline = latency
+            elif not saturated:
+                baseline += (latency - baseline) * 0.02
+            self._baselines[route] = baseline
+            congested = recent > baseline * self.tolerance
+
+        now = time.monotonic()
+        if saturated and congested:
+            if now - self._last_decrease >= self.decrease_interval:
+                self._last_decrease = now
+                self.limit = max(self.min_limit, self.limit * self.backoff)
+        elif (saturated and not congested) or self.limit < self.initial:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+        CONCURRENCY_LIMIT.set(self.limit)
+
+
+class AdaptiveConcurrencyMiddleware:
+    """
+    ASGI middleware admitting requests through an AdaptiveLimiter by route
+    priority. Shed requests get 503 with Retry-After before any routing,
+    body parsing or DB work happens.
+    """
+
+    def __init__(self, app: ASGIApp, limiter: AdaptiveLimiter, priorities: Mapping[str, Priority] = ROUTE_PRIORITIES):
+        self.app = app
+        self.limiter = limiter
+        self.priorities = priorities
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        path = scope["path"]
+        priority = self.priorities.get(path, Priority.NORMAL)
+        if priority is Priority.CRITICAL:
+            await self.app(scope, receive, send)
+            return
+        # Unknown paths share one baseline/label so scanners can't grow the maps
+        route = path if path in self.priorities else "other"
+        if not self.limiter.try_acquire(priority):
+            REQUESTS_SHED.inc(priority=priority.name.lower(), route=route)
+            response = Response(
+                SHED_BODY, status_code=503, headers={"Retry-After": "1"}, media_type="application/json"
+            )
+            await response(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            self.limiter.release(route, time.perf_counter() - start, status_code)
+
+
+concurrency_limiter = AdaptiveLimiter(
+    initial=settings.CONCURRENCY_INITIAL_LIMIT,
+    min_limit=settings.CONCURRENCY_MIN_LIMIT,
+    max_limit=settings.CONCURRENCY_MAX_LIMIT,
+    tolerance=settings.CONCURRENCY_LATENCY_TOLERANCE,
+)
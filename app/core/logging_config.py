@@ -0,0 +1,202 @@
+import copy
+import logging
+import queue
+import random
+import re
+import sys
+import traceback
+import uuid
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Mapping, Optional
+
+import orjson
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.metrics import Counter
+
+LOG_RECORDS_DROPPED = Counter("log_records_dropped_total", "Log records not written, by reason", ["reason"])
+
+request_id: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+request_route: ContextVar[Optional[str]] = ContextVar("request_route", default=None)
+
+# Client-supplied ids are echoed into logs and headers, so keep them boring
+_REQUEST_ID_RE = re.compile(r"^[A-Za-z0-9._:-]{1,64}$")
+
+# Attributes every LogRecord has; anything else came from `extra=`
+_RECORD_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {
+    "message", "asctime", "request_id", "route",
+}
+
+_SECRET_NAMES = r"otp|token|password|secret|api[_-]?key|authorization"
+_SECRET_KEY_RE = re.compile(rf"(?i)^.*({_SECRET_NAMES}).*$")
+_SECRET_PAIR_RE = re.compile(rf"(?i)\b((?:\w*(?:{_SECRET_NAMES})\w*)\s*[=:]\s*)(\"[^\"]*\"|'[^']*'|[^\s,;&]+)")
+_BEARER_RE = re.compile(r"(?i)\b(bearer\s+)[A-Za-z0-9._~+/=-]+")
+_JWT_RE = re.compile(r"\beyJ[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+")
+REDACTED = "[REDACTED]"
+
+
+def redact(text: str) -> str:
+    """Mask `name=value` pairs with secret-looking names, bearer tokens and JWTs."""
+    text = _SECRET_PAIR_RE.sub(lambda m: m.group(1) + REDACTED, text)
+    text = _BEARER_RE.sub(lambda m: m.group(1) + REDACTED, text)
+    return _JWT_RE.sub(REDACTED, text)
+
+
+def _redact_fields(fields: Mapping[str, Any]) -> Dict[str, Any]:
+    return {
+        key: REDACTED if _SECRET_KEY_RE.match(key) else (redact(value) if isinstance(value, str) else value)
+        for key, value in fields.items()
+    }
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line. Runs on the listener thread, off the event loop."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": redact(record.getMessage()),
+        }
+        if getattr(record, "request_id", None):
+            entry["request_id"] = record.request_id  # type: ignore[attr-defined]
+            entry["route"] = record.route  # type: ignore[attr-defined]
+        extra = {k: v for k, v in record.__dict__.items() if k not in _RECORD_ATTRS}
+        if extra:
+            entry.update(_redact_fields(extra))
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        return orjson.dumps(entry, default=str).decode()
+
+
+class TextFormatter(logging.Formatter):
+    def __init__(self) -> None:
+        super().__init__("%(asctime)s %(levelname)s [%(request_id)s] %(name)s: %(message)s")
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        record.message = redact(record.message)
+        if not getattr(record, "request_id", None):
+            record.request_id = "-"
+        return super().formatMessage(record)
+
+
+class ContextQueueHandler(QueueHandler):
+    """
+    Runs on the logging thread (usually the event loop): stamps the record
+    with the request id and route, applies per-route sampling to INFO and
+    below, and hands it to the listener thread. Expensive work (redaction,
+    JSON encoding, the actual write) happens on the listener. A full queue
+    drops the record instead of blocking the loop on a slow sink.
+    """
+
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord]", sample_rates: Mapping[str, float]):
+        super().__init__(log_queue)
+        self.sample_rates = dict(sample_rates)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        route = request_route.get()
+        if record.levelno <= logging.INFO and route is not None:
+            rate = self.sample_rates.get(route)
+            if rate is not None and random.random() >= rate:
+                LOG_RECORDS_DROPPED.inc(reason="sampled")
+                return
+        record.request_id = request_id.get()
+        record.route = route
+        super().emit(record)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Merge args now (they may be mutated later) but leave formatting to
+        # the listener's formatter
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = "".join(traceback.format_exception(*record.exc_info))
+            record.exc_info = None
+        record.stack_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            LOG_RECORDS_DROPPED.inc(reason="queue_full")
+
+
+_listener: Optional[QueueListener] = None
+
+
+def configure_logging() -> None:
+    """
+    Route every logger (uvicorn's included) through a bounded queue to a
+    single stdout writer thread. Called once per worker at startup.
+    """
+    global _listener
+    if _listener is not None:
+        return
+    stream = logging.StreamHandler(sys.stdout)
+    stream.setFormatter(JsonFormatter() if settings.LOG_FORMAT == "json" else TextFormatter())
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(settings.LOG_QUEUE_SIZE)
+    handler = ContextQueueHandler(log_queue, settings.LOG_SAMPLE_RATES)
+
+    root = logging.getLogger()
+    for existing in root.handlers[:]:
+        root.removeHandler(existing)
+    root.addHandler(handler)
+    root.setLevel(settings.LOG_LEVEL.upper())
+    # Let uvicorn's loggers propagate to the queue instead of writing directly
+    for name in ("uvicorn", "uvicorn.error", "uvicorn.access"):
+        logger = logging.getLogger(name)
+        logger.handlers.clear()
+        logger.propagate = True
+
+    _listener = QueueListener(log_queue, stream)
+    _listener.start()
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the writer thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+class RequestIdMiddleware:
+    """
+    Binds a request id (the caller's X-Request-ID if it looks sane, else a
+    new one) and the route path to the request's context for log records,
+    and echoes the id back in the X-Request-ID response header.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        supplied = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                supplied = value.decode("latin-1")
+                break
+        rid = supplied if supplied and _REQUEST_ID_RE.match(supplied) else uuid.uuid4().hex
+        id_token = request_id.set(rid)
+        route_token = request_route.set(scope["path"])
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append("X-Request-ID", rid)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_id.reset(id_token)
+            request_route.reset(route_token)
@@ -0,0 +1,122 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from typing import Dict, Optional
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.metrics import Counter, Histogram
+
+EVENT_LOOP_LAG = Histogram(
+    "event_loop_lag_seconds",
+    "How late the event loop woke the watchdog's timer",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+EVENT_LOOP_STALLS = Counter("event_loop_stalls_total", "Event loop stalls longer than the watchdog threshold")
+
+# Task -> ASGI scope of the request it is serving. Written on the loop
+# thread, read by the sidecar thread to name the route that blocked.
+_task_scopes: Dict[asyncio.Task, Scope] = {}
+
+
+def _route_name(scope: Optional[Scope]) -> str:
+    if scope is None:
+        return "<no request>"
+    # FastAPI stores the matched route in the (shared, mutated) scope once routing is done
+    route = scope.get("route")
+    return f"{scope.get('method', '')} {getattr(route, 'path', None) or scope.get('path', '?')}"
+
+
+class LoopWatchdog:
+    """
+    Measures event-loop lag with a timer task that sleeps `interval` seconds
+    and records how late it woke up. A sidecar thread watches the timer's
+    heartbeat; when it is overdue by more than `threshold`, the loop is
+    stuck in synchronous code, so the thread grabs the loop thread's current
+    stack plus the route of the running task and logs it, once per stall.
+    """
+
+    def __init__(self, interval: float = 0.05, threshold: float = 0.1):
+        self.interval = interval
+        self.threshold = threshold
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._heartbeat = 0.0
+        self._task: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+
+    def start(self) -> None:
+        if self._task is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stopping.clear()
+        self._task = asyncio.create_task(self._tick(), name="loop-watchdog")
+        self._thread = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._thread.start()
+
+    async def _tick(self) -> None:
+        while True:
+            start = time.monotonic()
+            await asyncio.sleep(self.interval)
+            self._heartbeat = now = time.monotonic()
+            EVENT_LOOP_LAG.observe(max(0.0, now - start - self.interval))
+
+    def _watch(self) -> None:
+        reported = 0.0
+        while not self._stopping.wait(self.threshold / 2):
+            beat = self._heartbeat
+            stalled = time.monotonic() - beat - self.interval
+            if stalled < self.threshold or beat == reported:
+                continue
+            reported = beat
+            frame = sys._current_frames().get(self._loop_thread_id)  # type: ignore[arg-type]
+            if frame is None:
+                continue
+            stack = "".join(traceback.format_stack(frame))
+            task = asyncio.current_task(self._loop)
+            EVENT_LOOP_STALLS.inc()
+            logging.warning(
+                "Event loop blocked for %.3fs+ in %s:\n%s",
+                stalled, _route_name(_task_scopes.get(task)), stack,  # type: ignore[arg-type]
+            )
+
+    async def stop(self) -> None:
+        self._stopping.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+
+class RouteTaggingMiddleware:
+    """Remembers which request each task serves, for the watchdog's stall reports."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        task = asyncio.current_task()
+        if scope["type"] != "http" or task is None:
+            await self.app(scope, receive, send)
+            return
+        _task_scopes[task] = scope
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _task_scopes.pop(task, None)
+
+
+loop_watchdog = LoopWatchdog(interval=settings.LOOP_WATCHDOG_INTERVAL, threshold=settings.LOOP_WATCHDOG_THRESHOLD)
@@ -0,0 +1,104 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from types import FrameType
+from typing import Dict, Optional
+
+MAX_PROFILE_SECONDS = 60.0
+MIN_INTERVAL = 0.001
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    filename = code.co_filename
+    if filename.startswith(_ROOT):
+        filename = os.path.relpath(filename, _ROOT)
+    else:
+        # site-packages/passlib/... -> passlib/...
+        parts = filename.replace("\\", "/").split("/site-packages/", 1)
+        filename = parts[-1] if len(parts) == 2 else os.path.basename(filename)
+    return f"{getattr(code, 'co_qualname', code.co_name)} ({filename}:{code.co_firstlineno})"
+
+
+def collapse_stack(frame: Optional[FrameType]) -> str:
+    """Root-to-leaf frames joined by ';', as expected by flamegraph.pl and speedscope."""
+    labels = []
+    while frame is not None:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    return ";".join(reversed(labels))
+
+
+class SamplingProfiler:
+    """
+    Statistical profiler: a background thread snapshots the stacks of the
+    event-loop thread (or every thread) with sys._current_frames() every
+    `interval` seconds. Costs one stack walk per sample and nothing when
+    not running; no signals, no sys.setprofile hooks. Stacks of code that
+    is waiting (e.g. the loop idling in select) are sampled too, so the
+    output shows where wall-clock time goes, not just CPU.
+    """
+
+    def __init__(self, target_thread_id: int, interval: float = 0.005, all_threads: bool = False):
+        self.target_thread_id = target_thread_id
+        self.interval = max(interval, MIN_INTERVAL)
+        self.all_threads = all_threads
+        self.samples = 0
+
+    def run(self, duration: float) -> Counter:
+        """Sample for `duration` seconds on the calling thread; returns stack -> sample count."""
+        counts: Counter = Counter()
+        own_id = threading.get_ident()
+        deadline = time.monotonic() + duration
+        while time.monotonic() < deadline:
+            names: Dict[int, str] = {}
+            if self.all_threads:
+                names = {t.ident: t.name for t in threading.enumerate() if t.ident is not None}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                if not self.all_threads and thread_id != self.target_thread_id:
+                    continue
+                stack = collapse_stack(frame)
+                if self.all_threads:
+                    stack = f"thread:{names.get(thread_id, thread_id)};{stack}"
+                counts[stack] += 1
+            self.samples += 1
+            time.sleep(self.interval)
+        return counts
+
+
+def render_collapsed(counts: Counter) -> str:
+    return "".join(f"{stack} {count}\n" for stack, count in sorted(counts.items()))
+
+
+_profile_lock = asyncio.Lock()
+
+
+async def profile_worker(seconds: float, interval: float, all_threads: bool = False) -> str:
+    """
+    Profile this worker for `seconds` and return collapsed stacks. Sampling
+    runs on a dedicated thread, not the shared executor, so hashing capacity
+    is untouched. Raises RuntimeError if a profile is already running.
+    """
+    if _profile_lock.locked():
+        raise RuntimeError("A profile is already running on this worker")
+    async with _profile_lock:
+        loop = asyncio.get_running_loop()
+        profiler = SamplingProfiler(threading.get_ident(), interval, all_threads)
+        done: asyncio.Future = loop.create_future()
+
+        def target() -> None:
+            try:
+                result = profiler.run(min(seconds, MAX_PROFILE_SECONDS))
+                loop.call_soon_threadsafe(done.set_result, result)
+            except BaseException as e:
+                loop.call_soon_threadsafe(done.set_exception, e)
+
+        threading.Thread(target=target, name="sampling-profiler", daemon=True).start()
+        return render_collapsed(await done)
@@ -0,0 +1,29 @@
+from typing import TYPE_CHECKING, Optional
+
+from app.core.config import settings
+from app.utils.lazy_import import lazy_import
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+redis_asyncio = lazy_import("redis.asyncio")
+
+_client: Optional["Redis"] = None
+
+
+def get_redis() -> Optional["Redis"]:
+    """
+    Shared Redis client, or None when REDIS_URL is not configured. Callers
+    fall back to per-worker state in that case.
+    """
+    global _client
+    if _client is None and settings.REDIS_URL:
+        _client = redis_asyncio.from_url(settings.REDIS_URL, decode_responses=True)
+    return _client
+
+
+async def close_redis() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -0,0 +1,31 @@
+from typing import Any
+
+import orjson
+from pydantic import BaseModel
+from starlette.responses import JSONResponse, Response
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson. Pydantic models are serialized
+    straight to bytes by their compiled serializer, without a dict round trip.
+    Returning one of these from a route also skips FastAPI's response_model
+    re-validation, so only return models the route built itself.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content)
+        return orjson.dumps(content)
+
+
+def prebuilt_json(content: Any) -> bytes:
+    """Serialize a constant response body once, at import time."""
+    if isinstance(content, BaseModel):
+        return content.__pydantic_serializer__.to_json(content)
+    return orjson.dumps(content)
+
+
+def json_bytes_response(body: bytes, status_code: int = 200) -> Response:
+    """Wrap an already-serialized JSON body in a fresh response."""
+    return Response(content=body, status_code=status_code, media_type="application/json")
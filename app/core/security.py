@@ -1,9 +1,195 @@
-from fastapi import Header, HTTPException, status
+import hashlib
+import hmac
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, FrozenSet, Optional, Tuple
+
+from fastapi import Depends, Header, HTTPException, Request, status
+from sqlalchemy import or_, select
+
 from app.core.config import settings
+from app.core.metrics import Counter
+from app.db.database import AsyncSessionLocal
+from app.db.models.api_key_model import ApiKey
+from app.utils.rate_limit import hit_fixed_window
+
+API_KEY_REQUESTS = Counter(
+    "api_key_requests_total", "Requests authenticated by API key, by client, key and outcome", ["client", "key_id", "outcome"]
+)
+API_KEY_CACHE = Counter("api_key_cache_total", "API key validation cache lookups", ["result"])
+
+
+@dataclass(frozen=True)
+class ApiClient:
+    key_id: str
+    client_name: str
+    scopes: FrozenSet[str]
+    rate_limit_per_minute: Optional[int] = None
+
+    def has_scope(self, scope: str) -> bool:
+        if scope in EXPLICIT_SCOPES:
+            return scope in self.scopes
+        return "*" in self.scopes or scope in self.scopes
+
+
+# Scopes "*" does not grant; a key must list them by name
+EXPLICIT_SCOPES = frozenset({"admin"})
+
+# The shared BACKEND_API_KEY, accepted alongside per-client keys for the
+# routes it always guarded
+LEGACY_CLIENT = ApiClient(key_id="legacy", client_name="legacy", scopes=frozenset({"auth", "introspect"}))
+
+
+def hash_api_key(key: str) -> str:
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+_legacy_digest = hash_api_key(settings.BACKEND_API_KEY) if settings.BACKEND_API_KEY else None
+
+
+def _bounded_put(entries: Dict[str, Tuple[Optional[ApiClient], float]], maxsize: int, key: str, value, expires: float) -> None:
+    now = time.monotonic()
+    if len(entries) >= maxsize:
+        for k in [k for k, (_, until) in entries.items() if until <= now]:
+            del entries[k]
+        while len(entries) >= maxsize:
+            del entries[next(iter(entries))]
+    entries[key] = (value, expires)
+
+
+class ApiKeyCache:
+    """
+    Per-worker TTL cache of key digest -> ApiClient. Bounds how long a
+    revoked key keeps working to `ttl` seconds. Unknown keys are kept
+    (for a shorter time) in a separate, smaller map, so a spray of random
+    keys can only evict other unknown keys, never valid clients.
+    """
+
+    def __init__(self, ttl: float, negative_ttl: float, maxsize: int = 10_000, negative_maxsize: int = 10_000):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.maxsize = maxsize
+        self.negative_maxsize = negative_maxsize
+        self._entries: Dict[str, Tuple[Optional[ApiClient], float]] = {}
+        self._negative: Dict[str, Tuple[Optional[ApiClient], float]] = {}
+
+    def get(self, digest: str) -> Tuple[bool, Optional[ApiClient]]:
+        now = time.monotonic()
+        for entries in (self._entries, self._negative):
+            entry = entries.get(digest)
+            if entry is not None and entry[1] > now:
+                API_KEY_CACHE.inc(result="hit")
+                return True, entry[0]
+        API_KEY_CACHE.inc(result="miss")
+        return False, None
 
-def api_key_validator(x_api_key: str = Header(...)):
-    if not x_api_key or x_api_key != settings.BACKEND_API_KEY:
+    def put(self, digest: str, client: Optional[ApiClient], ttl: Optional[float] = None) -> None:
+        now = time.monotonic()
+        if client is None:
+            _bounded_put(self._negative, self.negative_maxsize, digest, None, now + (ttl or self.negative_ttl))
+        else:
+            self._negative.pop(digest, None)
+            _bounded_put(self._entries, self.maxsize, digest, client, now + (self.ttl if ttl is None else ttl))
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._negative.clear()
+
+
+api_key_cache = ApiKeyCache(settings.API_KEY_CACHE_TTL, settings.API_KEY_NEGATIVE_CACHE_TTL)
+
+
+async def _load_client(digest: str) -> Optional[ApiClient]:
+    now = datetime.utcnow()
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(ApiKey).where(
+                ApiKey.key_hash == digest,
+                ApiKey.is_active.is_(True),
+                or_(ApiKey.expires_at.is_(None), ApiKey.expires_at > now),
+            )
+        )
+        row = result.scalar_one_or_none()
+    if row is None:
+        api_key_cache.put(digest, None)
+        return None
+    client = ApiClient(
+        key_id=str(row.id),
+        client_name=row.client_name,
+        scopes=frozenset(row.scopes),
+        rate_limit_per_minute=row.rate_limit_per_minute,
+    )
+    ttl = api_key_cache.ttl
+    if row.expires_at is not None:
+        ttl = min(ttl, (row.expires_at - now).total_seconds())
+    api_key_cache.put(digest, client, ttl)
+    return client
+
+
+class LookupRateLimited(Exception):
+    def __init__(self, retry_after: int):
+        self.retry_after = retry_after
+
+
+async def resolve_api_key(key: str, source: str = "") -> Optional[ApiClient]:
+    """
+    Map a presented key to its client; the DB is only queried on a cache
+    miss. Misses are rate limited per source address, so guessing keys
+    can't turn into a stream of primary-DB queries; a valid client only
+    misses once per cache TTL.
+    """
+    digest = hash_api_key(key)
+    if _legacy_digest is not None and hmac.compare_digest(digest, _legacy_digest):
+        return LEGACY_CLIENT
+    hit, client = api_key_cache.get(digest)
+    if hit:
+        return client
+    allowed, retry_after = await hit_fixed_window(f"api-key-lookup:{source}", settings.API_KEY_LOOKUP_RATE_LIMIT)
+    if not allowed:
+        raise LookupRateLimited(retry_after)
+    return await _load_client(digest)
+
+
+async def api_key_validator(request: Request, x_api_key: str = Header(...)) -> ApiClient:
+    source = request.client.host if request.client else ""
+    try:
+        client = await resolve_api_key(x_api_key, source) if x_api_key else None
+    except LookupRateLimited as e:
+        API_KEY_REQUESTS.inc(client="unknown", key_id="unknown", outcome="rate_limited")
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many unrecognized API keys",
+            headers={"Retry-After": str(e.retry_after)},
+        )
+    if client is None:
+        API_KEY_REQUESTS.inc(client="unknown", key_id="unknown", outcome="rejected")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or missing API key",
         )
+    if client.rate_limit_per_minute is not None:
+        allowed, retry_after = await hit_fixed_window(f"api-key-rate:{client.key_id}", client.rate_limit_per_minute)
+        if not allowed:
+            API_KEY_REQUESTS.inc(client=client.client_name, key_id=client.key_id, outcome="rate_limited")
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="API key rate limit exceeded",
+                headers={"Retry-After": str(retry_after)},
+            )
+    API_KEY_REQUESTS.inc(client=client.client_name, key_id=client.key_id, outcome="accepted")
+    return client
+
+
+def require_scope(scope: str):
+    """Dependency factory: a valid API key that also grants `scope`."""
+
+    async def dependency(client: ApiClient = Depends(api_key_validator)) -> ApiClient:
+        if not client.has_scope(scope):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"API key lacks the '{scope}' scope",
+            )
+        return client
+
+    return dependency
@@ -0,0 +1,52 @@
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import Histogram
+from app.db.query_stats import DbStats, request_db_stats
+
+DB_STATEMENTS_PER_REQUEST = Histogram(
+    "db_statements_per_request",
+    "SQL statements executed per request, by route",
+    ["route"],
+    buckets=(0, 1, 2, 3, 4, 5, 8, 13, 21),
+)
+
+
+class QueryStatsMiddleware:
+    """
+    Gives each request a fresh DbStats for the engine hooks to fill and
+    records the statement count per route. With `server_timing`, also adds
+    a Server-Timing header (db time and statement count, plus total time
+    to first byte) that shows up in browser devtools.
+    """
+
+    def __init__(self, app: ASGIApp, server_timing: bool = False):
+        self.app = app
+        self.server_timing = server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        stats = DbStats()
+        token = request_db_stats.set(stats)
+        start = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            if self.server_timing and message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                total_ms = (time.perf_counter() - start) * 1000
+                headers.append(
+                    "Server-Timing",
+                    f'db;dur={stats.seconds * 1000:.2f};desc="{stats.statements} statements", app;dur={total_ms:.2f}',
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_db_stats.reset(token)
+            route = scope.get("route")
+            DB_STATEMENTS_PER_REQUEST.observe(stats.statements, route=getattr(route, "path", "other"))
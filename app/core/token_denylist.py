@@ -0,0 +1,59 @@
+import time
+from typing import Any, Dict, Mapping, Optional, Set, Tuple
+
+
+class TokenDenylist:
+    """
+    Per-worker set of revoked token identifiers, checked on every access
+    token decode without a network hop.
+
+    Keys are "jti:<token id>", "sid:<session id>" or "sub:<user id>". A "sub"
+    entry revokes every token for the user issued at or before its revoked_at
+    timestamp. Entries are filed into buckets by expiry time, so expired
+    entries are dropped a whole bucket at a time instead of scanning the set.
+    Entries only need to live as long as the tokens they revoke.
+    """
+
+    def __init__(self, bucket_seconds: int = 60):
+        self.bucket_seconds = bucket_seconds
+        self._entries: Dict[str, Tuple[float, float]] = {}  # key -> (revoked_at, expires_at)
+        self._buckets: Dict[int, Set[str]] = {}
+        self._next_purge = 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, key: str, revoked_at: float, expires_at: float) -> None:
+        current = self._entries.get(key)
+        if current is not None:
+            revoked_at = max(revoked_at, current[0])
+            expires_at = max(expires_at, current[1])
+        self._entries[key] = (revoked_at, expires_at)
+        self._buckets.setdefault(int(expires_at // self.bucket_seconds), set()).add(key)
+
+    def purge(self, now: Optional[float] = None) -> None:
+        """Drop every bucket whose window has fully passed."""
+        now = time.time() if now is None else now
+        self._next_purge = now + self.bucket_seconds
+        current = int(now // self.bucket_seconds)
+        for index in [i for i in self._buckets if i < current]:
+            for key in self._buckets.pop(index):
+                entry = self._entries.get(key)
+                # A re-added key may have moved to a later bucket
+                if entry is not None and entry[1] <= now:
+                    del self._entries[key]
+
+    def is_revoked(self, claims: Mapping[str, Any]) -> bool:
+        if not self._entries:
+            return False
+        now = time.time()
+        if now >= self._next_purge:
+            self.purge(now)
+        entries = self._entries
+        if f"jti:{claims.get('jti')}" in entries or f"sid:{claims.get('sid')}" in entries:
+            return True
+        entry = entries.get(f"sub:{claims.get('sub')}")
+        return entry is not None and claims.get("iat", 0) <= entry[0]
+
+
+token_denylist = TokenDenylist()
@@ -1,14 +1,38 @@
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+import asyncio
+import logging
+from typing import Dict, Optional, Sequence
+
+from fastapi import Request
+from sqlalchemy import select, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, async_sessionmaker, AsyncSession
 
 from app.core.config import settings
 from app.db.models.base_model import Base
+from app.db.query_stats import instrument_engine
+from app.db.repositories.user_repository import email_matches
+from app.db.models.user_model import User
+from app.db.sharding import DEFAULT_SHARD, HashRing
+from app.utils.email_normalization import normalize_email
+from app.utils.jwt_utils import unverified_claims
+
+
+def create_engine(url: str) -> AsyncEngine:
+    engine = create_async_engine(
+        url,
+        echo=settings.DB_ECHO,
+        future=True,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=True,
+    )
+    instrument_engine(engine)
+    return engine
 
-# Create the async engine
-engine = create_async_engine(
-    settings.async_db_uri,
-    echo=settings.DB_ECHO,
-    future=True,
-)
+
+# Primary database: global tables (api_key, auth_event) and, unsharded, everything
+engine = create_engine(settings.async_db_uri)
 
 # Create a sessionmaker factory for async sessions
 AsyncSessionLocal = async_sessionmaker(
@@ -18,7 +42,151 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 
+class ShardMap:
+    """
+    Places each user, with their sessions, OTPs, onboarding row and reset
+    tokens, on one of several Postgres databases by consistent hash of the
+    normalized email. Every shard has its own engine and pool; a shard
+    whose URL is DATABASE_URL reuses the primary engine. With no shards
+    configured there is a single "default" shard, the primary.
+
+    While app.cli.reshard is moving users after a shard was added or
+    removed, `previous` holds the old ring: a user whose new owner doesn't
+    have them yet is still served from their old shard.
+
+    Tokens name the shard they were issued on and keep doing so after their
+    user is moved; token-only lookups that miss there follow the user ("sub")
+    with `find_user`, so no ring needs to be kept around for them.
+    """
+
+    def __init__(self, urls: Dict[str, str], previous: Sequence[str] = ()):
+        self.engines: Dict[str, AsyncEngine] = {}
+        self.primary = DEFAULT_SHARD
+        primary_url = make_url(settings.async_db_uri)
+        for name, url in (urls or {DEFAULT_SHARD: settings.async_db_uri}).items():
+            if make_url(url) == primary_url:
+                self.engines[name] = engine
+                self.primary = name
+            else:
+                self.engines[name] = create_engine(url)
+        if self.primary not in self.engines:
+            # DATABASE_URL holds only global tables; pre-sharding tokens go to the first shard
+            self.primary = sorted(self.engines)[0]
+        self._sessionmakers = {
+            name: async_sessionmaker(bind=shard_engine, expire_on_commit=False, class_=AsyncSession, info={"shard": name})
+            for name, shard_engine in self.engines.items()
+        }
+        self.ring = HashRing(self.engines)
+        unknown = set(previous) - set(self.engines)
+        if unknown:
+            raise ValueError(f"DATABASE_SHARDS_PREVIOUS names unknown shards: {sorted(unknown)}")
+        self.previous_ring = HashRing(previous) if previous and set(previous) != set(self.engines) else None
+
+    @property
+    def sharded(self) -> bool:
+        return len(self.engines) > 1
+
+    def owner(self, email: str) -> str:
+        """Shard a normalized email belongs on under the current ring."""
+        return self.ring.node_for(email)
+
+    async def locate(self, email: str) -> str:
+        """
+        Shard currently holding a normalized email's user, or where a new one
+        goes. Mid-reshard that is the new owner if the user is there, else
+        the old shard if they are still there, else (a new user) the new
+        owner: checking the owner first means a user moved between the two
+        checks is still found, and new users never land on a shard that a
+        later `move` would have to fight over.
+        """
+        owner = self.ring.node_for(email)
+        if self.previous_ring is None:
+            return owner
+        previous = self.previous_ring.node_for(email)
+        if previous == owner:
+            return owner
+        for shard in (owner, previous):
+            async with self.engines[shard].connect() as conn:
+                if await conn.scalar(select(User.id).where(email_matches(email))) is not None:
+                    return shard
+        return owner
+
+    def shard_for_claims(self, claims: Optional[dict]) -> str:
+        shard = (claims or {}).get("shard")
+        return shard if shard in self.engines else self.primary
+
+    async def find_user(self, user_id: str, exclude: Optional[str] = None) -> Optional[str]:
+        """Shard holding a user id, probing every shard but `exclude`; None if none has it."""
+
+        async def holds(shard: str) -> bool:
+            async with self.engines[shard].connect() as conn:
+                return await conn.scalar(select(User.id).where(User.id == user_id)) is not None
+
+        shards = sorted(set(self.engines) - {exclude})
+        found = await asyncio.gather(*(holds(shard) for shard in shards))
+        return next((shard for shard, held in zip(shards, found) if held), None)
+
+    def session(self, shard: str) -> AsyncSession:
+        return self._sessionmakers[shard]()
+
+
+shard_map = ShardMap(settings.DATABASE_SHARDS, settings.DATABASE_SHARDS_PREVIOUS)
+
+
+def all_engines() -> Dict[str, AsyncEngine]:
+    """Every shard's engine, plus the primary as "primary" when it isn't one of them."""
+    engines = dict(shard_map.engines)
+    if engine not in engines.values():
+        engines["primary"] = engine
+    return engines
+
+
+async def resolve_shard(request: Request) -> str:
+    """
+    Pick the shard for a request: from the "email" field of a JSON body,
+    else the "shard" claim of the refresh token cookie or bearer token,
+    else the primary. Claims are read unverified; the route still verifies
+    the token, so a forged claim only sends the request somewhere it fails.
+    A token issued before its user was resharded names the old shard; routes
+    that look up sessions by token fall back to `shard_map.find_user`.
+    """
+    if request.headers.get("content-type", "").startswith("application/json"):
+        try:
+            # Already parsed and cached by FastAPI for routes with a body
+            body = await request.json()
+        except ValueError:
+            body = None
+        if isinstance(body, dict) and isinstance(body.get("email"), str):
+            return await shard_map.locate(normalize_email(body["email"]))
+    token = request.cookies.get("refresh_token")
+    if not token:
+        scheme, _, credentials = request.headers.get("authorization", "").partition(" ")
+        token = credentials if scheme.lower() == "bearer" else None
+    return shard_map.shard_for_claims(unverified_claims(token) if token else None)
+
+
 # Dependency for FastAPI routes
-async def get_db_session():
-    async with AsyncSessionLocal() as session:
+async def get_db_session(request: Request):
+    shard = await resolve_shard(request) if shard_map.sharded else shard_map.primary
+    async with shard_map.session(shard) as session:
         yield session
+
+
+async def warm_db_pool(connections: int) -> None:
+    """Open `connections` pooled connections per shard up front so the first requests don't pay for connect."""
+
+    async def ping(shard_engine: AsyncEngine):
+        async with shard_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    results = await asyncio.gather(
+        *(ping(e) for e in all_engines().values() for _ in range(connections)), return_exceptions=True
+    )
+    failures = [r for r in results if isinstance(r, Exception)]
+    if failures:
+        logging.warning("DB pool warm-up: %s/%s connections failed: %s", len(failures), len(results), failures[0])
+
+
+async def dispose_engine() -> None:
+    for shard_engine in all_engines().values():
+        await shard_engine.dispose()
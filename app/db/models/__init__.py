@@ -3,3 +3,6 @@ from .session_model import Session
 from .onboarding_model import OnBoarding
 from .otp_model import Otp
 from .password_reset_token import PasswordResetToken
+from .token_revocation_model import TokenRevocation
+from .api_key_model import ApiKey
+from .auth_event_model import AuthEvent
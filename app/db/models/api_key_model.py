@@ -0,0 +1,26 @@
+from datetime import datetime
+from typing import List, Optional
+from sqlalchemy import String, DateTime, Integer, Boolean
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Mapped, mapped_column
+from .base_model import Base, IdType
+from app.utils.generate_id import generate_id
+
+
+class ApiKey(Base):
+    """
+    Backend client credential. Only the SHA-256 digest of the key is stored;
+    the plaintext is shown once when the key is created.
+    """
+
+    __tablename__ = "api_key"
+
+    id: Mapped[str] = mapped_column(IdType, primary_key=True, default=generate_id)
+    client_name: Mapped[str] = mapped_column(String, nullable=False)
+    key_prefix: Mapped[str] = mapped_column(String, nullable=False)
+    key_hash: Mapped[str] = mapped_column(String(64), unique=True, nullable=False)
+    scopes: Mapped[List[str]] = mapped_column(ARRAY(String), nullable=False, default=list)
+    rate_limit_per_minute: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True)
+    expires_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
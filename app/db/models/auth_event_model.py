@@ -0,0 +1,32 @@
+from datetime import datetime
+from typing import Any, Optional
+from sqlalchemy import String, DateTime, Index
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+from .base_model import Base, IdType
+from app.utils.generate_id import generate_id
+
+
+class AuthEvent(Base):
+    """
+    Append-only security audit log, range-partitioned by month on
+    occurred_at. Written in batches with COPY by app.services.audit_log;
+    no foreign keys, so events outlive the users they mention.
+    """
+
+    __tablename__ = "auth_event"
+
+    id: Mapped[str] = mapped_column(IdType, primary_key=True, default=generate_id)
+    occurred_at: Mapped[datetime] = mapped_column(DateTime, primary_key=True)
+    event_type: Mapped[str] = mapped_column(String, nullable=False)
+    outcome: Mapped[str] = mapped_column(String, nullable=False)
+    user_id: Mapped[Optional[str]] = mapped_column(IdType, nullable=True)
+    email: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    ip_address: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    user_agent: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    detail: Mapped[Optional[Any]] = mapped_column(JSONB, nullable=True)
+
+    __table_args__ = (
+        Index("ix_auth_event_user_id_occurred_at", "user_id", "occurred_at"),
+        {"postgresql_partition_by": "RANGE (occurred_at)"},
+    )
@@ -1,4 +1,8 @@
+from sqlalchemy import Uuid
 from sqlalchemy.ext.asyncio import AsyncAttrs
 from sqlalchemy.orm import declarative_base
 
-Base = declarative_base(cls=AsyncAttrs)
\ No newline at end of file
+Base = declarative_base(cls=AsyncAttrs)
+
+# Primary keys: native uuid on Postgres, exposed to Python as str
+IdType = Uuid(as_uuid=False)
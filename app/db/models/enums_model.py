@@ -11,3 +11,11 @@ class OtpPurpose(str, enum.Enum):
 class OtpType(str, enum.Enum):
     EMAIL_VERIFICATION = "EMAIL_VERIFICATION"
     PASSWORD_RESET = "PASSWORD_RESET"
+
+class AuthEventType(str, enum.Enum):
+    LOGIN = "LOGIN"
+    LOGOUT = "LOGOUT"
+    OTP_VERIFICATION = "OTP_VERIFICATION"
+    PASSWORD_RESET_REQUEST = "PASSWORD_RESET_REQUEST"
+    PASSWORD_RESET_OTP_VERIFICATION = "PASSWORD_RESET_OTP_VERIFICATION"
+    PASSWORD_RESET = "PASSWORD_RESET"
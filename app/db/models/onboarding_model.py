@@ -2,9 +2,9 @@ from sqlalchemy import String, Boolean, DateTime, ForeignKey, JSON
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
-from .base_model import Base
+from .base_model import Base, IdType
 from typing import Optional, TYPE_CHECKING
-from app.utils.generate_cuid import generate_cuid
+from app.utils.generate_id import generate_id
 
 if TYPE_CHECKING:
     from .user_model import User
@@ -12,7 +12,7 @@ if TYPE_CHECKING:
 class OnBoarding(Base):
     __tablename__ = "on_boarding"
 
-    id: Mapped[str] = mapped_column(String, primary_key=True, default=generate_cuid)
+    id: Mapped[str] = mapped_column(IdType, primary_key=True, default=generate_id)
     user_id: Mapped[str] = mapped_column(
         ForeignKey("user.id", ondelete="CASCADE"), unique=True
     )
@@ -1,14 +1,14 @@
 from datetime import datetime
 from sqlalchemy import String, DateTime, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column
-from .base_model import Base
-from app.utils.generate_cuid import generate_cuid
+from .base_model import Base, IdType
+from app.utils.generate_id import generate_id
 
 
 class PasswordResetToken(Base):
     __tablename__ = "password_reset_token"
 
-    id: Mapped[str] = mapped_column(String, primary_key=True, default=generate_cuid)
+    id: Mapped[str] = mapped_column(IdType, primary_key=True, default=generate_id)
     user_id: Mapped[str] = mapped_column(ForeignKey("user.id", ondelete="CASCADE"))
     token: Mapped[str] = mapped_column(String, unique=True, nullable=False)
     expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
@@ -3,18 +3,19 @@ from sqlalchemy import String, DateTime, ForeignKey, Index, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
-from .base_model import Base
+from .base_model import Base, IdType
 from .user_model import User
-from app.utils.generate_cuid import generate_cuid
+from app.utils.generate_id import generate_id
 
 
 class Session(Base):
     __tablename__ = "session"
 
-    id: Mapped[str] = mapped_column(String, primary_key=True, default=generate_cuid)
+    id: Mapped[str] = mapped_column(IdType, primary_key=True, default=generate_id)
     user_id: Mapped[str] = mapped_column(ForeignKey("user.id", ondelete="CASCADE"))
     refresh_token: Mapped[str] = mapped_column(Text)
-    expires_at: Mapped[DateTime] = mapped_column(DateTime)
+    # Partition key (daily ranges), hence part of the primary key
+    expires_at: Mapped[DateTime] = mapped_column(DateTime, primary_key=True)
     device_id: Mapped[str] = mapped_column(String)
     ip_address: Mapped[str] = mapped_column(String)
     user_agent: Mapped[Optional[str]] = mapped_column(String, nullable=True)
@@ -30,4 +31,5 @@ class Session(Base):
         Index("ix_session_user_id", "user_id"),
         Index("ix_session_device_id", "device_id"),
         Index("ix_session_refresh_token", "refresh_token"),
+        {"postgresql_partition_by": "RANGE (expires_at)"},
     )
@@ -0,0 +1,20 @@
+from datetime import datetime
+from sqlalchemy import String, DateTime, Index
+from sqlalchemy.orm import Mapped, mapped_column
+from .base_model import Base
+
+
+class TokenRevocation(Base):
+    """
+    Durable copy of the token denylist. Workers load unexpired rows at startup
+    and receive new ones through NOTIFY; rows are only kept until the tokens
+    they revoke would have expired anyway.
+    """
+
+    __tablename__ = "token_revocation"
+
+    key: Mapped[str] = mapped_column(String, primary_key=True)
+    revoked_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+    __table_args__ = (Index("ix_token_revocation_expires_at", "expires_at"),)
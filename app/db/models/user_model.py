@@ -1,11 +1,11 @@
-from sqlalchemy import String, Boolean, DateTime, Enum
+from sqlalchemy import String, Boolean, DateTime, Enum, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
-from .base_model import Base
+from .base_model import Base, IdType
 from .enums_model import UserRole, OtpPurpose
 from typing import Optional, List, TYPE_CHECKING
-from app.utils.generate_cuid import generate_cuid
+from app.utils.generate_id import generate_id
 
 
 if TYPE_CHECKING:
@@ -17,8 +17,8 @@ if TYPE_CHECKING:
 class User(Base):
     __tablename__ = "user"
 
-    id: Mapped[str] = mapped_column(String, primary_key=True, default=generate_cuid)
-    email: Mapped[str] = mapped_column(String, unique=True, nullable=False)
+    id: Mapped[str] = mapped_column(IdType, primary_key=True, default=generate_id)
+    email: Mapped[str] = mapped_column(String, nullable=False)
     password: Mapped[str] = mapped_column(String, nullable=False)
     role: Mapped[UserRole] = mapped_column(Enum(UserRole), default=UserRole.USER)
     is_email_verified: Mapped[bool] = mapped_column(Boolean, default=False)
@@ -43,3 +43,16 @@ class User(Base):
     otps: Mapped[List["Otp"]] = relationship(
         "Otp", back_populates="user", cascade="all, delete-orphan"
     )
+
+    __table_args__ = (
+        # Case-insensitive uniqueness. INCLUDE lets login/OTP/reset lookups be
+        # answered by an index-only scan; email itself is included because the
+        # planner only uses index-only scans on expression indexes when the
+        # underlying column is available from the index.
+        Index(
+            "ix_user_email_lower",
+            func.lower(email),
+            unique=True,
+            postgresql_include=["email", "id", "password", "is_email_verified"],
+        ),
+    )
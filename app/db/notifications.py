@@ -0,0 +1,96 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from app.db.database import all_engines
+
+NotifyHandler = Callable[[str], None]
+ConnectionHook = Callable[[Any], Awaitable[None]]
+
+MAINTENANCE_INTERVAL = 300.0
+
+
+class NotificationListener:
+    """
+    One dedicated asyncpg connection per worker and shard (outside the
+    SQLAlchemy pool) that LISTENs on every subscribed channel; a NOTIFY is
+    only delivered to listeners on the database it was sent on. `on_connect` hooks run
+    after subscribing, on the first connect and on every reconnect, so
+    subscribers can reload state they may have missed while disconnected.
+    Reconnects with backoff if the connection drops. Maintenance hooks run
+    on the same connection every MAINTENANCE_INTERVAL seconds.
+    """
+
+    def __init__(self) -> None:
+        self._handlers: Dict[str, NotifyHandler] = {}
+        self._on_connect: List[ConnectionHook] = []
+        self._maintenance: List[ConnectionHook] = []
+        self._tasks: List[asyncio.Task] = []
+
+    def subscribe(self, channel: str, handler: NotifyHandler, on_connect: Optional[ConnectionHook] = None) -> None:
+        """Register before start(); `handler` gets each payload on the event loop."""
+        self._handlers[channel] = handler
+        if on_connect is not None:
+            self._on_connect.append(on_connect)
+
+    def add_maintenance(self, hook: ConnectionHook) -> None:
+        self._maintenance.append(hook)
+
+    def start(self) -> None:
+        if not self._tasks and self._handlers:
+            self._tasks = [
+                asyncio.create_task(self._run(shard_engine.url), name=f"pg-notification-listener-{name}")
+                for name, shard_engine in all_engines().items()
+            ]
+
+    def _dispatch(self, connection, pid, channel, payload) -> None:
+        try:
+            self._handlers[channel](payload)
+        except Exception as e:
+            logging.warning("Error handling %s notification %r: %r", channel, payload, e)
+
+    async def _run(self, url: Any) -> None:
+        import asyncpg
+
+        dsn = url.set(drivername="postgresql").render_as_string(hide_password=False)
+        backoff = 1.0
+        while True:
+            conn = None
+            try:
+                conn = await asyncpg.connect(dsn)
+                lost = asyncio.Event()
+                conn.add_termination_listener(lambda _: lost.set())
+                for channel in self._handlers:
+                    await conn.add_listener(channel, self._dispatch)
+                for hook in self._on_connect:
+                    await hook(conn)
+                backoff = 1.0
+                while not lost.is_set():
+                    try:
+                        await asyncio.wait_for(lost.wait(), timeout=MAINTENANCE_INTERVAL)
+                    except asyncio.TimeoutError:
+                        for hook in self._maintenance:
+                            await hook(conn)
+                logging.warning("Notification listener connection lost, reconnecting")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logging.error("Notification listener failed, retrying in %.0fs: %r", backoff, e)
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 30.0)
+            finally:
+                if conn is not None and not conn.is_closed():
+                    await conn.close()
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._tasks = []
+
+
+notification_listener = NotificationListener()
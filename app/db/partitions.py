@@ -0,0 +1,117 @@
+import re
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.core.config import settings
+
+UPPER_BOUND_RE = re.compile(r"TO \('([^']+)'\)")
+
+
+@dataclass(frozen=True)
+class PartitionScheme:
+    """
+    How a range-partitioned table is laid out: one partition per `interval`
+    ("day" or "month") of `column`, created `ahead` periods in advance.
+    Partitions whose upper bound is older than `retention` are dropped;
+    with retention=None they are kept forever.
+    """
+
+    table: str
+    column: str
+    interval: str
+    ahead: int
+    retention: Optional[timedelta] = None
+
+
+PARTITIONED_TABLES: Dict[str, PartitionScheme] = {
+    # Sessions and OTPs are partitioned on expiry: once a partition's upper
+    # bound has passed, every row in it is expired and the whole partition
+    # can be dropped.
+    "session": PartitionScheme("session", "expires_at", "day", ahead=14, retention=timedelta(0)),
+    "otp": PartitionScheme("otp", "expires_at", "day", ahead=14, retention=timedelta(0)),
+    "auth_event": PartitionScheme(
+        "auth_event",
+        "occurred_at",
+        "month",
+        ahead=1,
+        retention=timedelta(days=settings.AUDIT_RETENTION_DAYS) if settings.AUDIT_RETENTION_DAYS > 0 else None,
+    ),
+}
+
+
+def month_start(d: date, offset: int = 0) -> date:
+    """First day of the month `offset` months after the one containing `d`."""
+    months = d.year * 12 + d.month - 1 + offset
+    return date(months // 12, months % 12 + 1, 1)
+
+
+def period_start(d: date, interval: str, offset: int = 0) -> date:
+    if interval == "day":
+        return d + timedelta(days=offset)
+    if interval == "month":
+        return month_start(d, offset)
+    raise ValueError(f"Unsupported partition interval {interval!r}")
+
+
+def partition_name(table: str, start: date, interval: str) -> str:
+    return f"{table}_{start:%Y_%m_%d}" if interval == "day" else f"{table}_{start:%Y_%m}"
+
+
+async def ensure_partitions(
+    conn: AsyncConnection, scheme: PartitionScheme, today: Optional[date] = None
+) -> List[str]:
+    """
+    Create the partitions covering the current period and the next
+    `scheme.ahead` periods. Existing partitions are skipped without taking
+    a lock on the parent. Returns the names of partitions created.
+    """
+    today = today or datetime.utcnow().date()
+    created = []
+    for offset in range(scheme.ahead + 1):
+        start = period_start(today, scheme.interval, offset)
+        end = period_start(start, scheme.interval, 1)
+        name = partition_name(scheme.table, start, scheme.interval)
+        exists = await conn.scalar(text("SELECT to_regclass(:name)"), {"name": f'"{name}"'})
+        if exists is not None:
+            continue
+        await conn.execute(
+            text(
+                f'CREATE TABLE IF NOT EXISTS "{name}" PARTITION OF "{scheme.table}" '
+                f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+            )
+        )
+        created.append(name)
+    return created
+
+
+async def list_partitions(conn: AsyncConnection, table: str) -> List[Tuple[str, Optional[datetime]]]:
+    """(partition name, exclusive upper bound) for each partition; None for the DEFAULT partition."""
+    result = await conn.execute(
+        text(
+            "SELECT c.relname, pg_get_expr(c.relpartbound, c.oid) "
+            "FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_class p ON p.oid = i.inhparent "
+            "WHERE p.relname = :table ORDER BY c.relname"
+        ),
+        {"table": table},
+    )
+    partitions = []
+    for name, bound in result:
+        match = UPPER_BOUND_RE.search(bound or "")
+        partitions.append((name, datetime.fromisoformat(match.group(1)) if match else None))
+    return partitions
+
+
+def expired_partitions(
+    partitions: List[Tuple[str, Optional[datetime]]], scheme: PartitionScheme, now: Optional[datetime] = None
+) -> List[str]:
+    """Partitions whose whole range lies before now - retention."""
+    if scheme.retention is None:
+        return []
+    cutoff = (now or datetime.utcnow()) - scheme.retention
+    return [name for name, upper in partitions if upper is not None and upper <= cutoff]
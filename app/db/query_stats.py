@@ -0,0 +1,81 @@
+import datetime
+import logging
+import time
+from contextvars import ContextVar
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+
+
+class DbStats:
+    """Statement count and DB time accumulated by one request."""
+
+    __slots__ = ("statements", "seconds")
+
+    def __init__(self) -> None:
+        self.statements = 0
+        self.seconds = 0.0
+
+
+# Mutated in place, so statements run in child tasks or SQLAlchemy's
+# greenlets (which inherit the context) add to the request's totals
+request_db_stats: ContextVar[Optional[DbStats]] = ContextVar("request_db_stats", default=None)
+
+
+def _redact(value: Any) -> str:
+    """Describe a bound parameter without revealing it (emails, hashes, tokens, OTPs)."""
+    if value is None:
+        return "NULL"
+    if isinstance(value, (bool, int, float, datetime.datetime, datetime.date)):
+        return type(value).__name__
+    if isinstance(value, (str, bytes)):
+        return f"{type(value).__name__}[{len(value)}]"
+    if isinstance(value, (list, tuple)):
+        return f"{type(value).__name__}[{len(value)}]"
+    return type(value).__name__
+
+
+def redact_parameters(parameters: Any, executemany: bool) -> str:
+    if executemany:
+        return f"<{len(parameters)} parameter sets>"
+    if isinstance(parameters, dict):
+        return "{" + ", ".join(f"{k}: {_redact(v)}" for k, v in parameters.items()) + "}"
+    if isinstance(parameters, (list, tuple)):
+        return "(" + ", ".join(_redact(v) for v in parameters) + ")"
+    return _redact(parameters)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start"].pop()
+    stats = request_db_stats.get()
+    if stats is not None:
+        stats.statements += 1
+        stats.seconds += elapsed
+    threshold = settings.SLOW_QUERY_THRESHOLD_MS
+    if threshold > 0 and elapsed * 1000 >= threshold:
+        logging.warning(
+            "Slow query (%.1f ms): %s params=%s",
+            elapsed * 1000, " ".join(statement.split()), redact_parameters(parameters, executemany),
+        )
+
+
+def _handle_error(exception_context):
+    # Keep the start-time stack balanced when a statement fails
+    starts = exception_context.connection.info.get("query_start") if exception_context.connection else None
+    if starts:
+        starts.pop()
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Hook statement counting, DB timing and the slow-query log into `engine`."""
+    sync_engine = engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
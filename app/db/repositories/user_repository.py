@@ -0,0 +1,139 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import Row, delete, func, insert, literal, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.base_model import IdType
+from app.db.models.enums_model import OtpType, UserRole
+from app.db.models.onboarding_model import OnBoarding
+from app.db.models.otp_model import Otp
+from app.db.models.password_reset_token import PasswordResetToken
+from app.db.models.session_model import Session
+from app.db.models.user_model import User
+from app.utils.generate_id import generate_id
+
+
+def email_matches(email: str):
+    """WHERE clause matching ix_user_email_lower. `email` must already be normalized."""
+    return func.lower(User.email) == email
+
+
+async def get_user_auth_row(db: AsyncSession, email: str) -> Optional[Row]:
+    """
+    Fetch (id, email, password, is_email_verified) for a normalized email.
+    Every selected column is covered by ix_user_email_lower, so Postgres can
+    answer this with an index-only scan instead of a heap fetch.
+    """
+    result = await db.execute(
+        select(User.id, User.email, User.password, User.is_email_verified).where(
+            email_matches(email)
+        )
+    )
+    return result.one_or_none()
+
+
+async def insert_user_with_onboarding_and_otp(
+    db: AsyncSession,
+    *,
+    email: str,
+    password_hash: str,
+    is_term_accepted: bool,
+    full_name: str,
+    otp_code: str,
+    otp_expires_at: datetime,
+) -> Optional[str]:
+    """
+    Create the user, its onboarding row and its verification OTP in one
+    statement. The data-modifying CTEs only insert onboarding/OTP rows for a
+    user row that was actually created; if the email already exists
+    (case-insensitively) ON CONFLICT DO NOTHING yields no row and this returns
+    None. Concurrent registrations for the same email serialize on the unique
+    index instead of failing with an IntegrityError.
+    """
+    user_table = User.__table__
+    new_user = (
+        pg_insert(user_table)
+        .values(
+            id=generate_id(),
+            email=email,
+            password=password_hash,
+            is_term_accepted=is_term_accepted,
+            # Python-side scalar defaults are not prefetched for DML inside
+            # CTEs, so they are spelled out here and below.
+            role=UserRole.USER,
+            is_email_verified=False,
+        )
+        .on_conflict_do_nothing(index_elements=[func.lower(user_table.c.email)])
+        .returning(user_table.c.id)
+        .cte("new_user")
+    )
+    new_onboarding = (
+        insert(OnBoarding.__table__)
+        .from_select(
+            ["id", "user_id", "full_name", "completed"],
+            select(
+                literal(generate_id(), IdType),
+                new_user.c.id,
+                literal(full_name),
+                literal(False),
+            ),
+        )
+        .cte("new_onboarding")
+    )
+    otp_table = Otp.__table__
+    new_otp = (
+        insert(otp_table)
+        .from_select(
+            ["id", "user_id", "code", "type", "expires_at"],
+            select(
+                literal(generate_id(), IdType),
+                new_user.c.id,
+                literal(otp_code),
+                literal(OtpType.EMAIL_VERIFICATION, otp_table.c.type.type),
+                literal(otp_expires_at, otp_table.c.expires_at.type),
+            ),
+        )
+        .cte("new_otp")
+    )
+    result = await db.execute(
+        select(new_user.c.id).add_cte(new_onboarding).add_cte(new_otp)
+    )
+    return result.scalar_one_or_none()
+
+
+async def reset_password_with_token(
+    db: AsyncSession, *, token: str, password_hash: str, now: datetime
+) -> Optional[Row]:
+    """
+    Consume a reset token, set the new password and purge the user's sessions
+    in one statement. The token UPDATE only matches an unused, unexpired row,
+    so two concurrent resets with the same token cannot both succeed; the
+    loser sees no row. Returns (id, email), or None if the token was invalid.
+    """
+    consumed = (
+        update(PasswordResetToken)
+        .where(
+            PasswordResetToken.token == token,
+            PasswordResetToken.used.is_(False),
+            PasswordResetToken.expires_at > now,
+        )
+        .values(used=True)
+        .returning(PasswordResetToken.user_id)
+        .cte("consumed")
+    )
+    updated = (
+        update(User)
+        .where(User.id.in_(select(consumed.c.user_id)))
+        .values(password=password_hash, updated_at=func.now())
+        .returning(User.id, User.email)
+        .cte("updated")
+    )
+    purged = (
+        delete(Session)
+        .where(Session.user_id.in_(select(updated.c.id)))
+        .cte("purged")
+    )
+    result = await db.execute(select(updated.c.id, updated.c.email).add_cte(purged))
+    return result.one_or_none()
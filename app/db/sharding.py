@@ -0,0 +1,33 @@
+import bisect
+import hashlib
+from typing import Iterable, List, Tuple
+
+DEFAULT_SHARD = "default"
+
+
+def _hash(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
+
+class HashRing:
+    """
+    Consistent hash ring over shard names. Each shard owns `vnodes` points
+    on the ring; a key belongs to the first point at or after its hash.
+    Adding or removing a shard only moves the keys between its points and
+    their predecessors, about 1/N of the users, so resharding copies the
+    minimum. Placement depends only on the set of names, not their order.
+    """
+
+    def __init__(self, nodes: Iterable[str], vnodes: int = 160):
+        self.nodes = sorted(set(nodes))
+        if not self.nodes:
+            raise ValueError("A hash ring needs at least one shard")
+        points: List[Tuple[int, str]] = sorted(
+            (_hash(f"{node}#{i}"), node) for node in self.nodes for i in range(vnodes)
+        )
+        self._hashes = [h for h, _ in points]
+        self._owners = [node for _, node in points]
+
+    def node_for(self, key: str) -> str:
+        index = bisect.bisect_left(self._hashes, _hash(key))
+        return self._owners[index % len(self._owners)]
@@ -1,28 +1,84 @@
-from fastapi import FastAPI, Depends
-from sqlalchemy.ext.asyncio import AsyncSession
-from app.db.database import get_db_session
-from sqlalchemy import text
+from fastapi import FastAPI, Depends, Request
+from sqlalchemy.exc import IntegrityError
+from fastapi.responses import PlainTextResponse
 from app.api.v1.register.register_router import router as register_router
 from app.api.v1.otp.otp_router import router as otp_router
 from app.api.v1.auth.auth_router import router as auth_router
 from app.api.v1.auth.logout_router import router as logout_router
 from app.api.v1.auth.password_reset_router import router as password_reset_router
 from app.api.v1.resend.resend_router import router as resend_router
-from app.core.security import api_key_validator
+from app.api.v1.introspect.introspect_router import router as introspect_router
+from app.api.v1.admin.profile_router import router as admin_profile_router
+from app.core.security import require_scope
+from app.core.responses import ORJSONResponse, json_bytes_response, prebuilt_json
+from app.core.health import health_prober
+from app.core.lifespan import lifespan
+from app.core.metrics import render_metrics
+from app.core.config import settings
+from app.core.load_shedding import AdaptiveConcurrencyMiddleware, concurrency_limiter
+from app.core.loop_watchdog import RouteTaggingMiddleware
+from app.core.server_timing import QueryStatsMiddleware
+from app.core.logging_config import RequestIdMiddleware
+from app.db.database import shard_map
 
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
+app.add_middleware(QueryStatsMiddleware, server_timing=settings.SERVER_TIMING_ENABLED and not settings.is_production)
+if settings.LOAD_SHEDDING_ENABLED:
+    app.add_middleware(AdaptiveConcurrencyMiddleware, limiter=concurrency_limiter)
+if settings.LOOP_WATCHDOG_ENABLED:
+    app.add_middleware(RouteTaggingMiddleware)
+# Outermost, so everything logged while serving a request carries its id
+app.add_middleware(RequestIdMiddleware)
 
-app.include_router(register_router, dependencies=[Depends(api_key_validator)])
-app.include_router(otp_router, dependencies=[Depends(api_key_validator)])
-app.include_router(resend_router, dependencies=[Depends(api_key_validator)])
+FOREIGN_KEY_VIOLATION = "23503"
+
+
+@app.exception_handler(IntegrityError)
+async def reshard_race(request: Request, exc: IntegrityError):
+    # Mid-reshard, a write for a user being moved (a login's session, an OTP)
+    # waits on the move's row lock, then finds the user gone from this shard.
+    # A retry is routed to the shard they were moved to.
+    if shard_map.previous_ring is not None and getattr(exc.orig, "sqlstate", None) == FOREIGN_KEY_VIOLATION:
+        return ORJSONResponse({"detail": "Please retry"}, status_code=503, headers={"Retry-After": "1"})
+    raise exc
+
+
+app.include_router(register_router, dependencies=[Depends(require_scope("auth"))])
+app.include_router(otp_router, dependencies=[Depends(require_scope("auth"))])
+app.include_router(resend_router, dependencies=[Depends(require_scope("auth"))])
+app.include_router(introspect_router, dependencies=[Depends(require_scope("introspect"))])
+app.include_router(admin_profile_router, dependencies=[Depends(require_scope("admin"))])
 app.include_router(auth_router)
 app.include_router(logout_router)
 app.include_router(password_reset_router)
 
 
-@app.get("/health")
-async def db_test(session: AsyncSession = Depends(get_db_session)):
-    result = await session.execute(text("SELECT 101"))
-    return {"db_response": result.scalar_one()}
+LIVE_BODY = prebuilt_json({"status": "ok"})
+
+
+@app.get("/livez", include_in_schema=False)
+async def livez():
+    # No I/O: a saturated DB pool must not get the pod restarted
+    return json_bytes_response(LIVE_BODY)
+
+
+@app.get("/readyz", include_in_schema=False)
+async def readyz():
+    report = health_prober.readiness()
+    return ORJSONResponse(report, status_code=503 if report["status"] == "not_ready" else 200)
+
+
+# Kept for existing probes; same answer as /readyz
+app.add_api_route("/health", readyz, methods=["GET"], include_in_schema=False)
+
 
+# Lists client names and key ids, plus shedding and breaker internals
+@app.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    include_in_schema=False,
+    dependencies=[Depends(require_scope("metrics"))],
+)
+async def metrics():
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
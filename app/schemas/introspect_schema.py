@@ -0,0 +1,24 @@
+from typing import List, Literal, Optional
+from pydantic import BaseModel, Field
+
+MAX_INTROSPECT_BATCH = 500
+
+
+class IntrospectRequest(BaseModel):
+    tokens: List[str] = Field(..., min_length=1, max_length=MAX_INTROSPECT_BATCH)
+    token_type_hint: Optional[Literal["access_token", "refresh_token"]] = None
+
+
+class TokenIntrospection(BaseModel):
+    active: bool
+    token_type: Optional[Literal["access_token", "refresh_token"]] = None
+    sub: Optional[str] = None
+    sid: Optional[str] = None
+    jti: Optional[str] = None
+    iat: Optional[int] = None
+    exp: Optional[int] = None
+
+
+class IntrospectResponse(BaseModel):
+    # Same order as the request's tokens; inactive entries are just {"active": false}
+    results: List[TokenIntrospection]
@@ -1,5 +1,6 @@
 from typing import Optional
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, validator
+from app.utils.email_normalization import normalize_email
 
 
 class LoginSchema(BaseModel):
@@ -7,6 +8,8 @@ class LoginSchema(BaseModel):
     password: str
     device_id: Optional[str] = None  # Optional, fallback if not provided
 
+    _normalize_email = validator('email', allow_reuse=True)(normalize_email)
+
 
 class LoginResponse(BaseModel):
     access_token: str
@@ -1,10 +1,20 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, validator
+from app.utils.email_normalization import normalize_email
+from app.core.responses import prebuilt_json
 
 
 class VerifyOtpSchema(BaseModel):
     email: EmailStr
     otp: str
 
+    _normalize_email = validator('email', allow_reuse=True)(normalize_email)
+
 
 class OtpVerifyResponse(BaseModel):
-    message: str
\ No newline at end of file
+    message: str
+
+
+EMAIL_VERIFIED_BODY = prebuilt_json(OtpVerifyResponse(message="Email verified successfully."))
+RESET_OTP_VERIFIED_BODY = prebuilt_json(
+    OtpVerifyResponse(message="OTP verified successfully. You can now reset your password.")
+)
@@ -1,14 +1,32 @@
-from pydantic import BaseModel, EmailStr
+from typing import Optional
+
+from pydantic import BaseModel, EmailStr, validator
+from app.utils.email_normalization import normalize_email
+from app.core.responses import prebuilt_json
+from app.core.config import settings
 
 
 class PasswordResetRequestSchema(BaseModel):
     email: EmailStr
 
+    _normalize_email = validator('email', allow_reuse=True)(normalize_email)
+
 
 class PasswordResetSchema(BaseModel):
     token: str
     new_password: str  # min_length will be validated in endpoint
+    email: Optional[EmailStr] = None  # routes the request to the user's shard; required when sharded
+
+    @validator('email', always=True)
+    def _email_routes_to_shard(cls, v):
+        if v is None and len(settings.DATABASE_SHARDS) > 1:
+            # Without it the request goes to the primary, which may not hold the token
+            raise ValueError("email is required")
+        return normalize_email(v) if v else v
 
 
 class PasswordResetResponse(BaseModel):
     message: str
+
+
+PASSWORD_RESET_BODY = prebuilt_json(PasswordResetResponse(message="Password reset successful."))
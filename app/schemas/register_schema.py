@@ -1,6 +1,8 @@
 from pydantic import BaseModel, EmailStr, Field, validator
 import re
 from typing import Optional
+from app.utils.disposable_domains import reject_disposable_email
+from app.utils.email_normalization import normalize_email
 
 
 class RegisterSchema(BaseModel):
@@ -120,19 +122,10 @@ class RegisterSchema(BaseModel):
     @validator('email')
     def validate_email_format(cls, email: str) -> str:
         """Additional email validation"""
-        email = email.lower().strip()
+        email = normalize_email(email)
         
-        # Check for common disposable email domains (optional security measure)
-        disposable_domains = [
-            "10minutemail.com", "tempmail.org", "guerrillamail.com",
-            "mailinator.com", "throwaway.email"
-        ]
-        
-        domain = email.split('@')[1] if '@' in email else ""
-        if domain in disposable_domains:
-            raise ValueError("Disposable email addresses are not allowed")
-        
-        return email
+        # Reject disposable email domains, including their subdomains
+        return reject_disposable_email(email)
 
 
 class RegisterResponse(BaseModel):
@@ -144,6 +137,9 @@ class RegisterResponse(BaseModel):
 class ResendOtpSchema(BaseModel):
     email: EmailStr
 
+    # No disposable-domain check: accounts that already exist must be able to recover
+    _normalize_email = validator('email', allow_reuse=True)(normalize_email)
+
 
 class ResendOtpResponse(BaseModel):
     message: str
\ No newline at end of file
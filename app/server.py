@@ -0,0 +1,35 @@
+"""
+Production entry point.
+
+    uv run python -m app.server
+
+Worker count, keep-alive, backlog, event loop and HTTP parser come from
+Settings (SERVER_* environment variables). Each worker runs the FastAPI
+lifespan in app/core/lifespan.py.
+"""
+import uvicorn
+
+from app.core.config import settings
+
+
+def main() -> None:
+    uvicorn.run(
+        "app.main:app",
+        host=settings.SERVER_HOST,
+        port=settings.SERVER_PORT,
+        workers=settings.SERVER_WORKERS,
+        loop=settings.SERVER_LOOP,  # type: ignore[arg-type]
+        http=settings.SERVER_HTTP,  # type: ignore[arg-type]
+        backlog=settings.SERVER_BACKLOG,
+        timeout_keep_alive=settings.SERVER_KEEP_ALIVE,
+        timeout_graceful_shutdown=settings.SERVER_GRACEFUL_SHUTDOWN_TIMEOUT,
+        proxy_headers=settings.SERVER_PROXY_HEADERS,
+        # Only trust X-Forwarded-For from the proxy: it sets session.ip_address and audit rows
+        forwarded_allow_ips=settings.SERVER_FORWARDED_ALLOW_IPS if settings.SERVER_PROXY_HEADERS else None,
+        # Each worker routes logging through app/core/logging_config.py
+        log_config=None,
+    )
+
+
+if __name__ == "__main__":
+    main()
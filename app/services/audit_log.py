@@ -0,0 +1,204 @@
+import asyncio
+import logging
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
+from starlette.requests import Request
+
+from app.core.config import settings
+from app.core.metrics import Counter, Gauge, Histogram
+from app.db.database import engine
+from app.db.models.enums_model import AuthEventType
+from app.db.partitions import PARTITIONED_TABLES, ensure_partitions
+from app.utils.generate_id import generate_id
+
+AUDIT_EVENTS = Counter("audit_events_total", "Audit events, by outcome in the pipeline", ["outcome"])
+AUDIT_QUEUE_DEPTH = Gauge("audit_queue_depth", "Audit events waiting to be written")
+AUDIT_FLUSH_SECONDS = Histogram("audit_flush_seconds", "Time to COPY one batch of audit events")
+
+TABLE = "auth_event"
+COLUMNS = ["id", "occurred_at", "event_type", "outcome", "user_id", "email", "ip_address", "user_agent", "detail"]
+OVERFLOW_POLICIES = ("drop", "block")
+FLUSH_ATTEMPTS = 3
+
+Record = Tuple[Any, ...]
+
+
+def _uuid(value: Optional[str]) -> Optional[uuid.UUID]:
+    return uuid.UUID(value) if value else None
+
+
+def request_context(request: Request) -> Dict[str, Optional[str]]:
+    """ip_address / user_agent keyword arguments for `AuditLog.record`."""
+    return {
+        "ip_address": request.client.host if request.client else None,
+        "user_agent": request.headers.get("user-agent"),
+    }
+
+
+class AuditLog:
+    """
+    Fire-and-forget audit pipeline. `record` puts the event on a bounded
+    per-worker queue; a background task drains it in batches of up to
+    `batch_size` (or whatever arrived within `flush_interval`) and writes each
+    batch with a single COPY into the partitioned auth_event table.
+
+    When the queue is full, the "drop" policy discards the event and counts
+    it, keeping request latency independent of the database; "block" makes
+    the request wait for room instead, so no event is lost while the
+    process is up. Remaining events are flushed on shutdown.
+    """
+
+    def __init__(self, maxsize: int, batch_size: int, flush_interval: float, overflow_policy: str):
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"AUDIT_OVERFLOW_POLICY must be one of {OVERFLOW_POLICIES}, got {overflow_policy!r}")
+        self.maxsize = maxsize
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow_policy = overflow_policy
+        self._queue: Optional[asyncio.Queue[Record]] = None
+        self._task: Optional[asyncio.Task] = None
+        self._partitions_month: Optional[Tuple[int, int]] = None
+        # Events taken off the queue but not yet committed, from the first
+        # one of a batch being gathered until its COPY succeeds; flushed by
+        # stop() if the writer is cancelled in between
+        self._in_flight: Optional[List[Record]] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0
+
+    def start(self) -> None:
+        if self.enabled and self._task is None:
+            self._queue = asyncio.Queue(self.maxsize)
+            self._task = asyncio.create_task(self._run(), name="audit-log-writer")
+
+    async def record(
+        self,
+        event_type: AuthEventType,
+        outcome: str,
+        *,
+        user_id: Optional[str] = None,
+        email: Optional[str] = None,
+        ip_address: Optional[str] = None,
+        user_agent: Optional[str] = None,
+        detail: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        if self._queue is None:
+            return
+        event = (
+            uuid.UUID(generate_id()),
+            datetime.utcnow(),
+            event_type.value,
+            outcome,
+            _uuid(user_id),
+            email,
+            ip_address,
+            user_agent,
+            orjson.dumps(detail).decode() if detail else None,
+        )
+        if self.overflow_policy == "block":
+            await self._queue.put(event)
+        else:
+            try:
+                self._queue.put_nowait(event)
+            except asyncio.QueueFull:
+                AUDIT_EVENTS.inc(outcome="dropped")
+                return
+        AUDIT_EVENTS.inc(outcome="queued")
+        AUDIT_QUEUE_DEPTH.set(self._queue.qsize())
+
+    def _drain(self, batch: List[Record]) -> None:
+        assert self._queue is not None
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+
+    async def _next_batch(self) -> List[Record]:
+        assert self._queue is not None
+        batch: List[Record] = []
+        self._in_flight = batch
+        batch.append(await self._queue.get())
+        deadline = time.monotonic() + self.flush_interval
+        self._drain(batch)
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+            self._drain(batch)
+        return batch
+
+    async def _copy(self, batch: List[Record]) -> None:
+        start = time.perf_counter()
+        async with engine.connect() as conn:
+            month = datetime.utcnow().timetuple()[:2]
+            if month != self._partitions_month:
+                await ensure_partitions(conn, PARTITIONED_TABLES[TABLE])
+                await conn.commit()
+                self._partitions_month = month
+            raw = await conn.get_raw_connection()
+            await raw.driver_connection.copy_records_to_table(TABLE, records=batch, columns=COLUMNS)
+            if batch is self._in_flight:
+                self._in_flight = None
+        AUDIT_FLUSH_SECONDS.observe(time.perf_counter() - start)
+
+    async def _write(self, batch: List[Record]) -> None:
+        for attempt in range(1, FLUSH_ATTEMPTS + 1):
+            try:
+                await self._copy(batch)
+                AUDIT_EVENTS.inc(len(batch), outcome="written")
+                return
+            except Exception as e:
+                if attempt == FLUSH_ATTEMPTS:
+                    AUDIT_EVENTS.inc(len(batch), outcome="failed")
+                    logging.error("Dropping %s audit events after %s failed writes: %r", len(batch), attempt, e)
+                    return
+                logging.warning("Audit event write failed (attempt %s), retrying: %r", attempt, e)
+                await asyncio.sleep(2**attempt)
+
+    async def _run(self) -> None:
+        assert self._queue is not None
+        while True:
+            batch = await self._next_batch()
+            AUDIT_QUEUE_DEPTH.set(self._queue.qsize())
+            await self._write(batch)
+            self._in_flight = None
+
+    async def stop(self, timeout: float = 5.0) -> None:
+        """Stop the writer and flush whatever is still queued, within `timeout` seconds."""
+        if self._task is None or self._queue is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        batch: List[Record] = self._in_flight or []
+        self._in_flight = None
+        while not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        if batch:
+            try:
+                await asyncio.wait_for(self._write(batch), timeout)
+            except asyncio.TimeoutError:
+                AUDIT_EVENTS.inc(len(batch), outcome="failed")
+                logging.error("Timed out flushing %s audit events at shutdown", len(batch))
+        AUDIT_QUEUE_DEPTH.set(0)
+
+
+audit_log = AuditLog(
+    maxsize=settings.AUDIT_QUEUE_SIZE,
+    batch_size=settings.AUDIT_BATCH_SIZE,
+    flush_interval=settings.AUDIT_FLUSH_INTERVAL,
+    overflow_policy=settings.AUDIT_OVERFLOW_POLICY,
+)
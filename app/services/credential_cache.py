@@ -0,0 +1,197 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import NamedTuple, Optional, Tuple
+
+import orjson
+from sqlalchemy import Row, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.metrics import Counter
+from app.core.redis_client import get_redis
+from app.db.notifications import notification_listener
+from app.db.repositories.user_repository import get_user_auth_row
+from app.utils.single_flight import SingleFlight
+
+CHANNEL = "credential_invalidation"
+
+CREDENTIAL_CACHE = Counter("credential_cache_total", "Login credential lookups, by tier and result", ["tier", "result"])
+CREDENTIAL_INVALIDATIONS = Counter(
+    "credential_cache_invalidations_total", "Credential cache invalidations applied, by source", ["source"]
+)
+
+
+class AuthRow(NamedTuple):
+    """Same fields as get_user_auth_row's Row, so callers don't care where it came from."""
+
+    id: str
+    email: str
+    password: str
+    is_email_verified: bool
+
+
+# Concurrent retries for the same email share one lookup
+user_lookups = SingleFlight("user_lookup")
+
+
+def _value_key(email: str) -> str:
+    return f"cred:{email}"
+
+
+def _version_key(email: str) -> str:
+    return f"credver:{email}"
+
+
+class LocalCredentialCache:
+    """Per-worker LRU of email -> (AuthRow, expiry)."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[AuthRow, float]]" = OrderedDict()
+        # Bumped by every invalidation; a loader that started before the bump
+        # must not store what it read
+        self.epoch = 0
+
+    def get(self, email: str) -> Optional[AuthRow]:
+        entry = self._entries.get(email)
+        if entry is None:
+            return None
+        if entry[1] <= time.monotonic():
+            del self._entries[email]
+            return None
+        self._entries.move_to_end(email)
+        return entry[0]
+
+    def put(self, email: str, row: AuthRow, epoch: int) -> None:
+        if epoch != self.epoch:
+            return
+        self._entries[email] = (row, time.monotonic() + self.ttl)
+        self._entries.move_to_end(email)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, email: str) -> None:
+        self.epoch += 1
+        self._entries.pop(email, None)
+
+    def clear(self) -> None:
+        self.epoch += 1
+        self._entries.clear()
+
+
+local_cache = LocalCredentialCache(settings.CREDENTIAL_CACHE_SIZE, settings.CREDENTIAL_CACHE_TTL)
+
+
+async def _redis_get(email: str) -> Tuple[Optional[AuthRow], str]:
+    """Cached row (if its version is current) and the current version."""
+    redis = get_redis()
+    if redis is None:
+        return None, "0"
+    try:
+        raw, version = await redis.mget(_value_key(email), _version_key(email))
+    except Exception as e:
+        logging.warning("Credential cache read failed: %r", e)
+        return None, "0"
+    version = version or "0"
+    if raw is None:
+        return None, version
+    entry = orjson.loads(raw)
+    # Written by a loader that read the DB before the last invalidation
+    if entry.pop("ver") != version:
+        return None, version
+    return AuthRow(**entry), version
+
+
+async def _redis_put(row: AuthRow, version: str) -> None:
+    redis = get_redis()
+    if redis is None:
+        return
+    value = orjson.dumps({**row._asdict(), "ver": version})
+    try:
+        await redis.set(_value_key(row.email), value, px=int(settings.CREDENTIAL_CACHE_TTL * 1000))
+    except Exception as e:
+        logging.warning("Credential cache write failed: %r", e)
+
+
+async def get_user_auth_row_shared(db: AsyncSession, email: str) -> Optional[Row]:
+    """get_user_auth_row, with concurrent identical lookups coalesced. Never cached."""
+    return await user_lookups.do(("db", email), lambda: get_user_auth_row(db, email))
+
+
+async def get_login_credentials(db: AsyncSession, email: str) -> Optional[AuthRow]:
+    """
+    Login's user lookup through the optional two-tier cache: per-worker LRU,
+    then Redis, then the covering-index query. Misses are not cached, so a
+    new registration is visible at once. Entries live at most
+    CREDENTIAL_CACHE_TTL seconds even if an invalidation is lost.
+    """
+    if not settings.CREDENTIAL_CACHE_ENABLED:
+        return await get_user_auth_row_shared(db, email)
+    row = local_cache.get(email)
+    if row is not None:
+        CREDENTIAL_CACHE.inc(tier="local", result="hit")
+        return row
+    return await user_lookups.do(("cached", email), lambda: _load_credentials(db, email))
+
+
+async def _load_credentials(db: AsyncSession, email: str) -> Optional[AuthRow]:
+    epoch = local_cache.epoch
+    row, version = await _redis_get(email)
+    if row is not None:
+        CREDENTIAL_CACHE.inc(tier="redis", result="hit")
+        local_cache.put(email, row, epoch)
+        return row
+    CREDENTIAL_CACHE.inc(tier="db", result="miss")
+    result = await get_user_auth_row(db, email)
+    if result is None:
+        return None
+    row = AuthRow(str(result.id), result.email, result.password, result.is_email_verified)
+    local_cache.put(email, row, epoch)
+    await _redis_put(row, version)
+    return row
+
+
+async def invalidate_credentials(db: AsyncSession, email: str) -> None:
+    """
+    Stage a cluster-wide invalidation in the caller's transaction. The
+    NOTIFY is delivered on commit, so every worker (this one included)
+    drops its entry and bumps the Redis version only once the new data is
+    visible to the query a re-load would run.
+    """
+    if not settings.CREDENTIAL_CACHE_ENABLED:
+        return
+    local_cache.invalidate(email)
+    await db.execute(select(func.pg_notify(CHANNEL, email)))
+
+
+def _on_invalidate(email: str) -> None:
+    local_cache.invalidate(email)
+    CREDENTIAL_INVALIDATIONS.inc(source="notify")
+    redis = get_redis()
+    if redis is not None:
+        # Every worker bumps it; any bump after the commit is enough
+        asyncio.get_running_loop().create_task(_bump_version(email))
+
+
+async def _bump_version(email: str) -> None:
+    redis = get_redis()
+    try:
+        async with redis.pipeline(transaction=False) as pipe:  # type: ignore[union-attr]
+            pipe.incr(_version_key(email))
+            # Outlives every value written under the old version
+            pipe.expire(_version_key(email), int(settings.CREDENTIAL_CACHE_TTL * 2) + 1)
+            await pipe.execute()
+    except Exception as e:
+        logging.warning("Credential cache version bump failed for an entry: %r", e)
+
+
+async def _on_connect(conn) -> None:
+    # Invalidations may have been missed while disconnected
+    local_cache.clear()
+
+
+if settings.CREDENTIAL_CACHE_ENABLED:
+    notification_listener.subscribe(CHANNEL, _on_invalidate, on_connect=_on_connect)
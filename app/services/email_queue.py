@@ -0,0 +1,124 @@
+import asyncio
+import heapq
+import itertools
+import logging
+from typing import List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.metrics import Counter, Gauge
+from app.services.email_transport import EmailMessage, get_email_transport, is_permanent_failure
+from app.utils.circuit_breaker import CircuitOpenError
+
+EMAIL_DEFERRED = Counter(
+    "email_deferred_total", "Emails deferred to the retry queue, by outcome", ["outcome"]
+)
+EMAIL_DEFER_QUEUE_DEPTH = Gauge("email_defer_queue_depth", "Emails waiting in the retry queue")
+
+
+class DeferredEmailQueue:
+    """
+    Bounded per-worker retry queue for emails that could not be delivered
+    synchronously (provider down or circuit open). Each message waits until
+    its own `not_before` time: exponential backoff after a failed send, or,
+    while the circuit is open, the circuit's reset timeout, which holds the
+    whole queue once instead of each message in turn. Rejections retrying
+    can't fix (a 4xx from the provider) are dropped at once. Messages still
+    queued at shutdown are lost; clients can use the resend endpoints to
+    request a fresh code.
+    """
+
+    def __init__(self, maxsize: int, max_attempts: int):
+        self.maxsize = maxsize
+        self.max_attempts = max_attempts
+        # (not_before, seq, message, attempt); seq keeps equal times in arrival order
+        self._heap: List[Tuple[float, int, EmailMessage, int]] = []
+        self._seq = itertools.count()
+        self._paused_until = 0.0
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0
+
+    def start(self) -> None:
+        if self.enabled and self._task is None:
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run(), name="deferred-email-queue")
+
+    def offer(self, message: EmailMessage) -> bool:
+        """Queue a message for retry. Returns False if deferral is unavailable or the queue is full."""
+        if self._wakeup is None:
+            return False
+        if not self._push(0.0, next(self._seq), message, 0):
+            EMAIL_DEFERRED.inc(outcome="dropped")
+            return False
+        EMAIL_DEFERRED.inc(outcome="queued")
+        return True
+
+    def _push(self, not_before: float, seq: int, message: EmailMessage, attempt: int) -> bool:
+        if len(self._heap) >= self.maxsize:
+            return False
+        heapq.heappush(self._heap, (not_before, seq, message, attempt))
+        EMAIL_DEFER_QUEUE_DEPTH.set(len(self._heap))
+        assert self._wakeup is not None
+        self._wakeup.set()
+        return True
+
+    async def _next_due(self) -> Tuple[float, int, EmailMessage, int]:
+        assert self._wakeup is not None
+        loop = asyncio.get_running_loop()
+        while True:
+            self._wakeup.clear()
+            if not self._heap:
+                await self._wakeup.wait()
+                continue
+            delay = max(self._heap[0][0], self._paused_until) - loop.time()
+            if delay <= 0:
+                entry = heapq.heappop(self._heap)
+                EMAIL_DEFER_QUEUE_DEPTH.set(len(self._heap))
+                return entry
+            try:
+                # Woken early if an earlier message arrives
+                await asyncio.wait_for(self._wakeup.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            not_before, seq, message, attempt = await self._next_due()
+            try:
+                await get_email_transport().send(message)
+                EMAIL_DEFERRED.inc(outcome="delivered")
+                continue
+            except CircuitOpenError:
+                # Every message would be rejected the same way: pause the whole
+                # queue and put this one back where it was
+                self._paused_until = loop.time() + settings.EMAIL_BREAKER_RESET_TIMEOUT
+            except Exception as e:
+                attempt += 1
+                if is_permanent_failure(e) or attempt >= self.max_attempts:
+                    EMAIL_DEFERRED.inc(outcome="dropped")
+                    logging.error("Giving up on deferred email to %s after %s attempts: %s", message.to, attempt, e)
+                    continue
+                not_before, seq = loop.time() + min(2**attempt, 60), next(self._seq)
+            if not self._push(not_before, seq, message, attempt):
+                EMAIL_DEFERRED.inc(outcome="dropped")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._heap:
+            logging.warning("Dropping %s deferred emails at shutdown", len(self._heap))
+            self._heap.clear()
+            EMAIL_DEFER_QUEUE_DEPTH.set(0)
+        self._wakeup = None
+
+
+deferred_emails = DeferredEmailQueue(settings.EMAIL_DEFER_QUEUE_SIZE, settings.EMAIL_DEFER_MAX_ATTEMPTS)
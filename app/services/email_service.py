@@ -1,68 +1,48 @@
-import asyncio
 import logging
-from app.core.config import settings
-import resend
-
-resend.api_key = settings.RESEND_API_KEY
+from app.services.email_queue import deferred_emails
+from app.services.email_templates import VERIFICATION_EMAIL, PASSWORD_RESET_EMAIL
+from app.services.email_transport import get_email_transport
 
 
 async def send_verification_email(email: str, otp: str) -> None:
     """
-    Sends a verification email with the provided OTP to the specified email address using Resend.
+    Sends a verification email with the provided OTP to the specified email address.
     Args:
         email (str): Recipient's email address.
         otp (str): One-time password to include in the email.
     Raises:
-        Exception: If sending the email fails.
-    """
-    subject = "Your Verification Code"
-    html_content = f"""
-    <p>Hello,</p>
-    <p>Your verification code is: <strong>{otp}</strong></p>
-    <p>If you did not request this, please ignore this email.</p>
+        Exception: If sending the email fails and it cannot be deferred for retry.
     """
-    params = {
-        "from": settings.RESEND_FROM_EMAIL,
-        "to": [email],
-        "subject": subject,
-        "html": html_content,
-    }
+    message = VERIFICATION_EMAIL.render(email, otp=otp)
     try:
-        result = await asyncio.to_thread(resend.Emails.send, params)  # type:ignore
-        logging.info(f"Verification email sent to {email}: {result}")
-        logging.debug(f"OTP sent to {email}: {otp}")
+        result = await get_email_transport().send(message)
+        logging.info("Verification email sent to %s: %s", email, result)
     except Exception as e:
-        logging.error(f"Failed to send verification email to {email}: {e}")
+        if deferred_emails.offer(message):
+            logging.warning("Verification email to %s deferred for retry: %r", email, e)
+            return
+        logging.error("Failed to send verification email to %s: %s", email, e)
         raise
 
 
 async def send_password_reset_email(email: str, otp: str) -> None:
     """
-    Sends a password reset OTP to the specified email address using Resend.
+    Sends a password reset OTP to the specified email address.
     Args:
         email (str): Recipient's email address.
         otp (str): One-time password to include in the email.
     Raises:
-        Exception: If sending the email fails.
-    """
-    subject = "Password Reset OTP"
-    html_content = f"""
-    <p>Hello,</p>
-    <p>You requested a password reset. Your OTP is: <strong>{otp}</strong></p>
-    <p>If you did not request this, please ignore this email.</p>
+        Exception: If sending the email fails and it cannot be deferred for retry.
     """
-    params = {
-        "from": settings.RESEND_FROM_EMAIL,
-        "to": [email],
-        "subject": subject,
-        "html": html_content,
-    }
+    message = PASSWORD_RESET_EMAIL.render(email, otp=otp)
     try:
-        result = await asyncio.to_thread(resend.Emails.send, params)  # type:ignore
-        logging.info(f"Password reset OTP sent to {email}: {result}")
-        logging.debug(f"Password reset OTP sent to {email}: {otp}")
+        result = await get_email_transport().send(message)
+        logging.info("Password reset OTP sent to %s: %s", email, result)
     except Exception as e:
-        logging.error(f"Failed to send password reset OTP to {email}: {e}")
+        if deferred_emails.offer(message):
+            logging.warning("Password reset OTP to %s deferred for retry: %r", email, e)
+            return
+        logging.error("Failed to send password reset OTP to %s: %s", email, e)
         raise
 
 
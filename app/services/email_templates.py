@@ -0,0 +1,35 @@
+from dataclasses import dataclass
+from html import escape
+from string import Template
+
+from app.services.email_transport import EmailMessage
+
+
+@dataclass(frozen=True)
+class EmailTemplate:
+    subject: str
+    html: Template
+
+    def render(self, to: str, **values: str) -> EmailMessage:
+        html = self.html.substitute({k: escape(v) for k, v in values.items()})
+        return EmailMessage(to=to, subject=self.subject, html=html)
+
+
+# Parsed once at import (worker startup); rendering is a single substitution.
+VERIFICATION_EMAIL = EmailTemplate(
+    subject="Your Verification Code",
+    html=Template(
+        "<p>Hello,</p>"
+        "<p>Your verification code is: <strong>$otp</strong></p>"
+        "<p>If you did not request this, please ignore this email.</p>"
+    ),
+)
+
+PASSWORD_RESET_EMAIL = EmailTemplate(
+    subject="Password Reset OTP",
+    html=Template(
+        "<p>Hello,</p>"
+        "<p>You requested a password reset. Your OTP is: <strong>$otp</strong></p>"
+        "<p>If you did not request this, please ignore this email.</p>"
+    ),
+)
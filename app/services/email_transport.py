@@ -0,0 +1,267 @@
+import asyncio
+import logging
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from app.core.config import settings
+from app.core.metrics import Counter, Gauge, Histogram
+from app.utils.circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
+from app.utils.lazy_import import lazy_import
+
+httpx = lazy_import("httpx")
+aiosmtplib = lazy_import("aiosmtplib")
+
+
+@dataclass(frozen=True)
+class EmailMessage:
+    to: str
+    subject: str
+    html: str
+
+
+class EmailTransport(ABC):
+    """Delivers an EmailMessage. `send` returns the provider's message id."""
+
+    name: str
+
+    @abstractmethod
+    async def send(self, message: EmailMessage) -> str: ...
+
+    async def aclose(self) -> None:
+        return None
+
+
+class ResendHttpTransport(EmailTransport):
+    """
+    Resend REST API over a shared httpx.AsyncClient. The client keeps a
+    keep-alive pool (HTTP/2 when enabled, multiplexing concurrent sends over
+    one connection) for the life of the worker, so sends neither open a new
+    connection nor occupy an executor thread.
+    """
+
+    name = "resend"
+
+    def __init__(self) -> None:
+        self._client = httpx.AsyncClient(
+            base_url=settings.RESEND_API_URL,
+            headers={"Authorization": f"Bearer {settings.RESEND_API_KEY}"},
+            http2=settings.EMAIL_HTTP2,
+            timeout=settings.EMAIL_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=settings.EMAIL_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.EMAIL_MAX_CONNECTIONS,
+            ),
+        )
+
+    async def send(self, message: EmailMessage) -> str:
+        response = await self._client.post(
+            "/emails",
+            json={
+                "from": settings.RESEND_FROM_EMAIL,
+                "to": [message.to],
+                "subject": message.subject,
+                "html": message.html,
+            },
+        )
+        response.raise_for_status()
+        return response.json().get("id", "")
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+class SmtpTransport(EmailTransport):
+    """
+    Plain SMTP via aiosmtplib. With the defaults it targets a local stand-in:
+    `python -m aiosmtpd -n -l localhost:1025`.
+    """
+
+    name = "smtp"
+
+    async def send(self, message: EmailMessage) -> str:
+        from email.message import EmailMessage as MimeMessage
+        from email.utils import make_msgid
+
+        mime = MimeMessage()
+        mime["From"] = settings.RESEND_FROM_EMAIL
+        mime["To"] = message.to
+        mime["Subject"] = message.subject
+        mime["Message-ID"] = make_msgid()
+        mime.set_content(message.html, subtype="html")
+        await aiosmtplib.send(
+            mime,
+            hostname=settings.SMTP_HOST,
+            port=settings.SMTP_PORT,
+            username=settings.SMTP_USERNAME,
+            password=settings.SMTP_PASSWORD,
+            start_tls=settings.SMTP_START_TLS,
+            timeout=settings.EMAIL_TIMEOUT,
+        )
+        return mime["Message-ID"]
+
+
+EMAIL_SENDS = Counter(
+    "email_sends_total", "Email send attempts by transport and outcome", ["transport", "outcome"]
+)
+EMAIL_SEND_SECONDS = Histogram("email_send_seconds", "Email send latency", ["transport"])
+EMAIL_CIRCUIT_STATE = Gauge(
+    "email_circuit_state", "Email circuit breaker state (0=closed, 1=half-open, 2=open)", ["transport"]
+)
+EMAIL_HEDGED_SENDS = Counter(
+    "email_hedged_sends_total", "Sends duplicated to the secondary transport after the hedge delay"
+)
+
+
+def _on_circuit_change(name: str, state: CircuitState) -> None:
+    EMAIL_CIRCUIT_STATE.set(state, transport=name)
+    logging.warning("Email circuit for %s is now %s", name, state.name)
+
+
+def is_permanent_failure(error: BaseException) -> bool:
+    """
+    The provider rejected the message itself (Resend 4xx other than 408/429,
+    SMTP 5xx): sending it again can only fail the same way.
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return 400 <= status < 500 and status not in (408, 429)
+    if isinstance(error, aiosmtplib.SMTPResponseException):
+        return 500 <= error.code < 600
+    return False
+
+
+class ResilientTransport(EmailTransport):
+    """
+    Wraps the primary transport (and an optional secondary) with a circuit
+    breaker each. While the primary's circuit is open, sends fail fast with
+    CircuitOpenError, or go straight to the secondary if one is configured.
+    With a hedge delay, a send still pending on the primary after that delay
+    is also started on the secondary and the first success wins; the loser is
+    cancelled, though a provider may already have accepted it, so hedging
+    trades an occasional duplicate email for bounded latency.
+    """
+
+    def __init__(
+        self,
+        primary: EmailTransport,
+        secondary: Optional[EmailTransport] = None,
+        hedge_delay: Optional[float] = None,
+    ):
+        self.primary = primary
+        self.secondary = secondary
+        self.hedge_delay = hedge_delay
+        self.name = primary.name
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        for transport in filter(None, (primary, secondary)):
+            self.breakers[transport.name] = CircuitBreaker(
+                transport.name,
+                failure_threshold=settings.EMAIL_BREAKER_FAILURE_THRESHOLD,
+                slow_call_seconds=settings.EMAIL_BREAKER_SLOW_CALL_SECONDS,
+                reset_timeout=settings.EMAIL_BREAKER_RESET_TIMEOUT,
+                on_state_change=_on_circuit_change,
+            )
+            EMAIL_CIRCUIT_STATE.set(CircuitState.CLOSED, transport=transport.name)
+
+    async def _call(self, transport: EmailTransport, message: EmailMessage) -> str:
+        breaker = self.breakers[transport.name]
+        if not breaker.allow_request():
+            EMAIL_SENDS.inc(transport=transport.name, outcome="rejected")
+            raise CircuitOpenError(f"Email circuit for {transport.name} is open")
+        start = time.monotonic()
+        try:
+            result = await transport.send(message)
+        except asyncio.CancelledError:
+            breaker.record_abandoned()
+            EMAIL_SENDS.inc(transport=transport.name, outcome="cancelled")
+            raise
+        except Exception:
+            breaker.record_failure()
+            EMAIL_SENDS.inc(transport=transport.name, outcome="error")
+            raise
+        elapsed = time.monotonic() - start
+        breaker.record_success(elapsed)
+        EMAIL_SEND_SECONDS.observe(elapsed, transport=transport.name)
+        EMAIL_SENDS.inc(transport=transport.name, outcome="ok")
+        return result
+
+    async def send(self, message: EmailMessage) -> str:
+        if self.secondary is None:
+            return await self._call(self.primary, message)
+        if not self.hedge_delay:
+            try:
+                return await self._call(self.primary, message)
+            except Exception as e:
+                logging.warning("Primary email transport failed, using %s: %r", self.secondary.name, e)
+                return await self._call(self.secondary, message)
+
+        primary = asyncio.create_task(self._call(self.primary, message))
+        pending = {primary}
+        error: Optional[BaseException] = None
+        # Everything after create_task is covered, so a cancelled caller never orphans a send
+        try:
+            done, pending = await asyncio.wait(pending, timeout=self.hedge_delay)
+            if done:
+                error = primary.exception()
+                if error is None:
+                    return primary.result()
+            else:
+                EMAIL_HEDGED_SENDS.inc()
+            pending.add(asyncio.create_task(self._call(self.secondary, message)))
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+            raise error  # type: ignore[misc]
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def circuit_states(self) -> Dict[str, CircuitState]:
+        """Breaker state per transport; no network I/O, so cheap enough for health probes."""
+        return {name: breaker.state for name, breaker in self.breakers.items()}
+
+    async def aclose(self) -> None:
+        await self.primary.aclose()
+        if self.secondary is not None:
+            await self.secondary.aclose()
+
+
+TRANSPORTS = {
+    "resend": ResendHttpTransport,
+    "smtp": SmtpTransport,
+}
+
+_transport: Optional[ResilientTransport] = None
+
+
+def _build_transport(name: str) -> EmailTransport:
+    try:
+        return TRANSPORTS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown email transport {name!r}; expected one of {sorted(TRANSPORTS)}") from None
+
+
+def get_email_transport() -> ResilientTransport:
+    """Return the worker's transport, creating it on first use."""
+    global _transport
+    if _transport is None:
+        primary = _build_transport(settings.EMAIL_TRANSPORT)
+        secondary = None
+        if settings.EMAIL_SECONDARY_TRANSPORT and settings.EMAIL_SECONDARY_TRANSPORT != primary.name:
+            secondary = _build_transport(settings.EMAIL_SECONDARY_TRANSPORT)
+        _transport = ResilientTransport(primary, secondary, settings.EMAIL_HEDGE_DELAY)
+        logging.info(
+            "Email transport: %s%s", primary.name, f" (secondary: {secondary.name})" if secondary else ""
+        )
+    return _transport
+
+
+async def close_email_transport() -> None:
+    global _transport
+    if _transport is not None:
+        await _transport.aclose()
+        _transport = None
@@ -0,0 +1,112 @@
+import asyncio
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import Text, any_, bindparam, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.database import shard_map
+from app.db.models.session_model import Session
+from app.utils.jwt_utils import decode_access_token, decode_refresh_token
+
+INACTIVE: Dict[str, Any] = {"active": False}
+CLAIMS = ("sub", "sid", "jti", "iat", "exp")
+
+_DECODERS = {
+    "access_token": decode_access_token,
+    "refresh_token": decode_refresh_token,
+}
+
+
+def _decode(token: str, hint: Optional[str]) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+    # Per RFC 7662 the hint only picks which type to try first
+    order = ("refresh_token", "access_token") if hint == "refresh_token" else ("access_token", "refresh_token")
+    for token_type in order:
+        claims = _DECODERS[token_type](token)
+        if claims:
+            return token_type, claims
+    return None, None
+
+
+async def _live_refresh_tokens(db: AsyncSession, tokens: List[str]) -> set:
+    """One round trip for the whole batch; a single array parameter keeps the statement cacheable."""
+    result = await db.execute(
+        select(Session.refresh_token).where(
+            Session.refresh_token == any_(bindparam("tokens", tokens, type_=ARRAY(Text))),
+            Session.expires_at > datetime.utcnow(),
+        )
+    )
+    return set(result.scalars())
+
+
+async def _live_refresh_tokens_on_shard(shard: str, tokens: List[str]) -> set:
+    async with shard_map.session(shard) as db:
+        return await _live_refresh_tokens(db, tokens)
+
+
+async def _live_refresh_tokens_sharded(decoded: Dict[str, Tuple[Optional[str], Optional[Dict[str, Any]]]]) -> set:
+    """
+    Sessions live on their user's shard: one query per shard named in the
+    tokens, concurrently. Tokens issued before their user was resharded
+    name the old shard; misses are retried on the shard now holding "sub".
+    """
+    by_shard: Dict[str, List[str]] = {}
+    for token, (token_type, claims) in decoded.items():
+        if token_type == "refresh_token":
+            by_shard.setdefault(shard_map.shard_for_claims(claims), []).append(token)
+    found = await asyncio.gather(*(_live_refresh_tokens_on_shard(s, t) for s, t in by_shard.items()))
+    live = set().union(*found)
+
+    moved: Dict[Tuple[str, str], List[str]] = {}
+    for shard, shard_tokens in by_shard.items():
+        for token in shard_tokens:
+            user_id = (decoded[token][1] or {}).get("sub")
+            if token not in live and user_id:
+                moved.setdefault((shard, user_id), []).append(token)
+    if moved:
+        holders = await asyncio.gather(*(shard_map.find_user(u, exclude=s) for s, u in moved))
+        retry: Dict[str, List[str]] = {}
+        for holder, shard_tokens in zip(holders, moved.values()):
+            if holder is not None:
+                retry.setdefault(holder, []).extend(shard_tokens)
+        found = await asyncio.gather(*(_live_refresh_tokens_on_shard(s, t) for s, t in retry.items()))
+        live.update(*found)
+    return live
+
+
+async def introspect_tokens(
+    tokens: List[str], hint: Optional[str], db: AsyncSession
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Introspect a batch of tokens. Access tokens are checked statelessly
+    (signature, expiry and the revocation denylist); refresh tokens must also
+    still have a session. Returns the results in request order and how many
+    seconds they may be cached: never past the earliest exp among active
+    tokens, and never more than INTROSPECT_CACHE_MAX_AGE.
+    """
+    decoded = {token: _decode(token, hint) for token in set(tokens)}
+    if shard_map.sharded:
+        live = await _live_refresh_tokens_sharded(decoded)
+    else:
+        refresh = [token for token, (token_type, _) in decoded.items() if token_type == "refresh_token"]
+        live = await _live_refresh_tokens(db, refresh) if refresh else set()
+
+    now = int(time.time())
+    max_age = settings.INTROSPECT_CACHE_MAX_AGE
+    results = []
+    for token in tokens:
+        token_type, claims = decoded[token]
+        if claims is None or (token_type == "refresh_token" and token not in live):
+            results.append(INACTIVE)
+            continue
+        entry = {"active": True, "token_type": token_type}
+        entry.update((claim, claims[claim]) for claim in CLAIMS if claim in claims)
+        if "iat" in entry:
+            # Tokens carry a millisecond iat; RFC 7662 consumers expect whole seconds
+            entry["iat"] = int(entry["iat"])
+        results.append(entry)
+        max_age = min(max_age, claims.get("exp", now) - now)
+    return results, max(max_age, 0)
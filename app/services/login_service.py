@@ -1,12 +1,15 @@
 from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.future import select
-from passlib.hash import argon2
 from datetime import datetime, timedelta
 
-from app.db.models.user_model import User
 from app.db.models.session_model import Session
+from app.db.models.enums_model import AuthEventType
+from app.services.audit_log import audit_log
+from app.services.credential_cache import get_login_credentials
+from app.utils.generate_id import generate_id
 from app.utils.jwt_utils import create_access_token, create_refresh_token
+from app.utils.password_hashing import verify_password
+from app.core.executors import run_blocking
 from app.schemas.login_schema import LoginSchema
 
 
@@ -17,17 +20,29 @@ async def login_service(
     ip_address: str,
     user_agent: str,
 ):
-    result = await db.execute(select(User).where(User.email == payload.email))
-    user = result.scalar_one_or_none()
-    if not user or not argon2.verify(payload.password, user.password):
+    user = await get_login_credentials(db, payload.email)
+    if not user or not await run_blocking(verify_password, payload.password, user.password):
+        await audit_log.record(
+            AuthEventType.LOGIN,
+            "failure",
+            user_id=user.id if user else None,
+            email=payload.email,
+            ip_address=ip_address,
+            user_agent=user_agent,
+        )
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
-    access_token = create_access_token({"sub": user.id})
-    refresh_token = create_refresh_token({"sub": user.id})
+    # The session id goes into both tokens so logout can revoke them together;
+    # the shard lets token-only requests find the session's database
+    session_id = generate_id()
+    claims = {"sub": user.id, "sid": session_id, "shard": db.info.get("shard")}
+    access_token = create_access_token(claims)
+    refresh_token = create_refresh_token(claims)
 
     # Save session
     expires_at = datetime.utcnow() + timedelta(days=7)
     session = Session(
+        id=session_id,
         user_id=user.id,
         refresh_token=refresh_token,
         expires_at=expires_at,
@@ -37,5 +52,14 @@ async def login_service(
     )
     db.add(session)
     await db.commit()
+    await audit_log.record(
+        AuthEventType.LOGIN,
+        "success",
+        user_id=user.id,
+        email=payload.email,
+        ip_address=ip_address,
+        user_agent=user_agent,
+        detail={"session_id": session_id, "device_id": device_id},
+    )
 
     return access_token, refresh_token
@@ -0,0 +1,51 @@
+import logging
+import time
+from typing import Dict
+
+from app.core.config import settings
+from app.core.metrics import Counter
+from app.core.redis_client import get_redis
+from app.db.models.enums_model import OtpType
+
+OTP_SENDS_AVOIDED = Counter(
+    "otp_sends_avoided_total", "OTP regenerations and emails skipped by the resend cooldown", ["purpose"]
+)
+
+# Fallback when Redis is not configured: per-worker, so with several workers
+# a user may get up to one send per worker per window.
+_local_windows: Dict[str, float] = {}
+
+
+def _key(user_id: str, purpose: OtpType) -> str:
+    return f"otp-cooldown:{purpose.value}:{user_id}"
+
+
+async def acquire_otp_cooldown(user_id: str, purpose: OtpType) -> bool:
+    """
+    Open the resend window for (user, purpose) if none is open.
+    Returns True if the caller should generate and send a code, False if a
+    code was sent within the last OTP_RESEND_COOLDOWN_SECONDS.
+    Enforced with a single atomic Redis SET NX PX; fails open if Redis is down.
+    """
+    window = settings.OTP_RESEND_COOLDOWN_SECONDS
+    if window <= 0:
+        return True
+    key = _key(user_id, purpose)
+    redis = get_redis()
+    if redis is not None:
+        try:
+            acquired = bool(await redis.set(key, "1", nx=True, px=window * 1000))
+        except Exception as e:
+            logging.warning("OTP cooldown check failed, allowing send: %r", e)
+            return True
+    else:
+        now = time.monotonic()
+        acquired = _local_windows.get(key, 0.0) <= now
+        if acquired:
+            if len(_local_windows) > 10_000:
+                for k in [k for k, expires in _local_windows.items() if expires <= now]:
+                    del _local_windows[k]
+            _local_windows[key] = now + window
+    if not acquired:
+        OTP_SENDS_AVOIDED.inc(purpose=purpose.value)
+    return acquired
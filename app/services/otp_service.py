@@ -1,19 +1,20 @@
 from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import update
 from sqlalchemy.future import select
 from datetime import datetime
 from app.db.models.user_model import User
 from app.db.models.otp_model import Otp
 from app.db.models.enums_model import OtpType
-from app.schemas.otp_schema import VerifyOtpSchema, OtpVerifyResponse
+from app.schemas.otp_schema import VerifyOtpSchema
+from app.services.credential_cache import get_user_auth_row_shared, invalidate_credentials
 
 
 async def verify_otp_service(
     payload: VerifyOtpSchema, db: AsyncSession
-) -> OtpVerifyResponse:
+) -> None:
     # 1. Get user
-    user_result = await db.execute(select(User).where(User.email == payload.email))
-    user = user_result.scalar_one_or_none()
+    user = await get_user_auth_row_shared(db, payload.email)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
@@ -41,8 +42,10 @@ async def verify_otp_service(
         raise HTTPException(status_code=400, detail="OTP expired")
 
     # 3. Mark user as verified
-    user.is_email_verified = True
+    await db.execute(
+        update(User).where(User.id == user.id).values(is_email_verified=True)
+    )
     # Delete the OTP after successful verification
     await db.delete(otp)
+    await invalidate_credentials(db, user.email)
     await db.commit()
-    return OtpVerifyResponse(message="Email verified successfully.")
@@ -1,21 +1,28 @@
 import secrets
 from datetime import datetime, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.future import select
 from fastapi import HTTPException
-from app.db.models.user_model import User
 from app.db.models.password_reset_token import PasswordResetToken
+from app.db.repositories.user_repository import reset_password_with_token
+from app.core.executors import run_blocking
 from app.services.email_service import send_verification_email
+from app.services.otp_cooldown import acquire_otp_cooldown
+from app.services.credential_cache import get_user_auth_row_shared, invalidate_credentials
+from app.services.token_revocation import revoke_user_tokens
+from app.db.models.enums_model import OtpType
+from app.utils.password_hashing import hash_password
 
 RESET_TOKEN_EXPIRY_HOURS = 1
 
 
 async def request_password_reset(email: str, db: AsyncSession):
-    result = await db.execute(select(User).where(User.email == email))
-    user = result.scalar_one_or_none()
+    user = await get_user_auth_row_shared(db, email)
     if not user:
         # Don't reveal if user exists
         return
+    # Shares the resend window, so repeated requests don't each send an email
+    if not await acquire_otp_cooldown(user.id, OtpType.PASSWORD_RESET):
+        return
     otp = f"{secrets.randbelow(1000000):06d}"
     expires_at = datetime.utcnow() + timedelta(hours=RESET_TOKEN_EXPIRY_HOURS)
     reset_token = PasswordResetToken(user_id=user.id, token=otp, expires_at=expires_at)
@@ -24,33 +31,20 @@ async def request_password_reset(email: str, db: AsyncSession):
     await send_verification_email(user.email, otp)
 
 
-async def reset_password(token: str, new_password: str, db: AsyncSession):
-    result = await db.execute(
-        select(PasswordResetToken).where(PasswordResetToken.token == token)
-    )
-    reset_token = result.scalar_one_or_none()
-    if (
-        not reset_token
-        or reset_token.used
-        or reset_token.expires_at < datetime.utcnow()
-    ):
-        raise HTTPException(status_code=400, detail="Invalid or expired token")
-    user_result = await db.execute(select(User).where(User.id == reset_token.user_id))
-    user = user_result.scalar_one_or_none()
-    if not user:
-        raise HTTPException(status_code=400, detail="User not found")
-    from passlib.hash import argon2
+async def reset_password(token: str, new_password: str, db: AsyncSession) -> str:
+    # Hash first: no connection is checked out until the statement below
+    password_hash = await run_blocking(hash_password, new_password)
 
-    # Hash the new password
-    user.password = argon2.hash(new_password)
-    
-    # Mark the reset token as used
-    reset_token.used = True
-    
-    # Invalidate all existing sessions for this user (security best practice)
-    from app.db.models.session_model import Session
-    await db.execute(
-        Session.__table__.delete().where(Session.user_id == user.id)
+    # Consume the token, update the password and invalidate all existing
+    # sessions (security best practice) in a single round trip
+    user = await reset_password_with_token(
+        db, token=token, password_hash=password_hash, now=datetime.utcnow()
     )
-    
+    if user is None:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="Invalid or expired token")
+    # Sessions are gone; also deny access tokens already handed out
+    await revoke_user_tokens(db, user.id)
+    await invalidate_credentials(db, user.email)
     await db.commit()
+    return user.id
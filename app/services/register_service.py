@@ -1,64 +1,57 @@
 from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.future import select
 from app.schemas.register_schema import RegisterSchema, RegisterResponse
-from app.db.models.user_model import User
-from app.db.models.otp_model import Otp
-from app.db.models.enums_model import OtpType
-from app.db.models.onboarding_model import OnBoarding
+from app.db.repositories.user_repository import insert_user_with_onboarding_and_otp
+from app.core.executors import run_blocking
 from app.utils.otp_generator import generate_otp
-from passlib.hash import argon2
+from app.utils.password_hashing import hash_password
 import logging
 from app.services.email_service import send_verification_email
+from app.services.otp_cooldown import acquire_otp_cooldown
+from app.services.credential_cache import invalidate_credentials
+from app.db.models.enums_model import OtpType
 from datetime import datetime, timedelta
 
 
 async def register_user_service(
     payload: RegisterSchema, db: AsyncSession
 ) -> RegisterResponse:
-    # 1. User existence check
-    result = await db.execute(select(User).where(User.email == payload.email))
-    if result.scalar_one_or_none():
-        raise HTTPException(status_code=400, detail="Email already registered")
-
-    # 2. Terms acceptance check
+    # 1. Terms acceptance check
     if not payload.is_term_accepted:
         raise HTTPException(
             status_code=400, detail="Terms and Conditions must be accepted"
         )
 
-    # 3. Password hashing
-    hashed_password = argon2.hash(payload.password)
-
-    # 4. User creation (without full_name)
-    user = User(email=payload.email, password=hashed_password)
-    db.add(user)
-    await db.flush()  # To get user.id
+    # 2. Password hashing, off the event loop and before any connection is checked out
+    hashed_password = await run_blocking(hash_password, payload.password)
 
-    # 5. OnBoarding record with full_name
-    onboarding = OnBoarding(user_id=user.id, full_name=payload.full_name)
-    db.add(onboarding)
-
-    # 6. OTP generation and storage (use enum value)
+    # 3. User, OnBoarding and OTP rows in a single statement
     otp_code = generate_otp()
-    otp = Otp(
-        user_id=user.id,
-        code=otp_code,
-        type=OtpType.EMAIL_VERIFICATION,
-        expires_at=datetime.utcnow() + timedelta(minutes=10),
+    user_id = await insert_user_with_onboarding_and_otp(
+        db,
+        email=payload.email,
+        password_hash=hashed_password,
+        is_term_accepted=payload.is_term_accepted,
+        full_name=payload.full_name,
+        otp_code=otp_code,
+        otp_expires_at=datetime.utcnow() + timedelta(minutes=10),
     )
-    db.add(otp)
-
+    if user_id is None:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="Email already registered")
+    await invalidate_credentials(db, payload.email)
     await db.commit()
 
-    # 7. Send verification email
+    # 4. Send verification email; opening the resend window means an
+    # immediate "resend" doesn't replace the code just sent
+    await acquire_otp_cooldown(user_id, OtpType.EMAIL_VERIFICATION)
     await send_verification_email(email=payload.email, otp=otp_code)
 
-    # 8. Logging
-    logging.info(f"User registered: {user.email}, OTP sent: {otp_code}")
+    # 5. Logging
+    logging.info("User registered: %s, verification OTP sent", payload.email)
 
     return RegisterResponse(
         message="Registration successful. Please verify your email.",
         email=payload.email,
-        user_id=str(user.id)
+        user_id=str(user_id)
     )
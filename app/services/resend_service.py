@@ -1,21 +1,31 @@
 from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.future import select
-from app.db.models.user_model import User
 from app.db.models.otp_model import Otp
 from app.db.models.enums_model import OtpType
 from app.db.models.password_reset_token import PasswordResetToken
+from app.services.credential_cache import get_user_auth_row_shared
 from app.utils.otp_generator import generate_otp
 from app.services.email_service import send_verification_email
+from app.services.otp_cooldown import acquire_otp_cooldown
+from app.utils.single_flight import SingleFlight
 from datetime import datetime, timedelta
 import logging
 
+# Duplicate resends arriving together share one OTP and one email. Across
+# workers the OTP cooldown does the same job, at the cost of a lookup each.
+resends = SingleFlight("otp_resend")
+
 
 async def resend_email_verification_otp(email: str, db: AsyncSession):
     """Resend email verification OTP"""
+    await resends.do(
+        (OtpType.EMAIL_VERIFICATION, email), lambda: _resend_email_verification_otp(email, db)
+    )
+
+
+async def _resend_email_verification_otp(email: str, db: AsyncSession):
     # Check if user exists
-    result = await db.execute(select(User).where(User.email == email))
-    user = result.scalar_one_or_none()
+    user = await get_user_auth_row_shared(db, email)
     if not user:
         raise HTTPException(status_code=400, detail="User not found")
     
@@ -23,6 +33,10 @@ async def resend_email_verification_otp(email: str, db: AsyncSession):
     if user.is_email_verified:
         raise HTTPException(status_code=400, detail="Email already verified")
     
+    # A code was sent moments ago: keep it and skip regeneration and email
+    if not await acquire_otp_cooldown(user.id, OtpType.EMAIL_VERIFICATION):
+        return
+    
     # Delete existing OTP for this user
     await db.execute(
         Otp.__table__.delete().where(
@@ -45,18 +59,25 @@ async def resend_email_verification_otp(email: str, db: AsyncSession):
     # Send verification email
     await send_verification_email(email=email, otp=otp_code)
     
-    logging.info(f"OTP resent to {email}: {otp_code}")
+    logging.info("Verification OTP resent to %s", email)
 
 
 async def resend_password_reset_otp(email: str, db: AsyncSession):
     """Resend password reset OTP"""
+    await resends.do((OtpType.PASSWORD_RESET, email), lambda: _resend_password_reset_otp(email, db))
+
+
+async def _resend_password_reset_otp(email: str, db: AsyncSession):
     # Check if user exists
-    result = await db.execute(select(User).where(User.email == email))
-    user = result.scalar_one_or_none()
+    user = await get_user_auth_row_shared(db, email)
     if not user:
         # Don't reveal if user exists for security
         return
     
+    # A code was sent moments ago: keep it and skip regeneration and email
+    if not await acquire_otp_cooldown(user.id, OtpType.PASSWORD_RESET):
+        return
+    
     # Delete existing password reset tokens for this user
     await db.execute(
         PasswordResetToken.__table__.delete().where(
@@ -80,4 +101,4 @@ async def resend_password_reset_otp(email: str, db: AsyncSession):
     # Send password reset email
     await send_verification_email(email=email, otp=otp)
     
-    logging.info(f"Password reset OTP resent to {email}: {otp}")
+    logging.info("Password reset OTP resent to %s", email)
@@ -0,0 +1,88 @@
+import logging
+import time
+from datetime import datetime, timezone
+
+import orjson
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.metrics import Counter
+from app.core.token_denylist import token_denylist
+from app.db.models.token_revocation_model import TokenRevocation
+from app.db.notifications import notification_listener
+from app.utils.jwt_utils import ACCESS_TOKEN_TTL
+
+CHANNEL = "token_revocation"
+
+TOKEN_REVOCATIONS = Counter(
+    "token_revocations_total", "Token denylist entries, by kind and where they came from", ["kind", "source"]
+)
+
+
+def _utc(ts: float) -> datetime:
+    return datetime.fromtimestamp(ts, timezone.utc).replace(tzinfo=None)
+
+
+async def _revoke(db: AsyncSession, key: str) -> None:
+    """
+    Stage a denylist entry in the caller's transaction. The row insert and
+    the NOTIFY both take effect on commit, so other workers never see a
+    revocation that was rolled back. The local denylist is updated at once;
+    a rollback then only over-revokes on this worker until the entry expires.
+    """
+    revoked_at = time.time()
+    expires_at = revoked_at + ACCESS_TOKEN_TTL.total_seconds()
+    payload = orjson.dumps({"k": key, "r": revoked_at, "e": expires_at}).decode()
+    stmt = pg_insert(TokenRevocation).values(
+        key=key, revoked_at=_utc(revoked_at), expires_at=_utc(expires_at)
+    )
+    upserted = stmt.on_conflict_do_update(
+        index_elements=[TokenRevocation.key],
+        set_={
+            "revoked_at": func.greatest(TokenRevocation.revoked_at, stmt.excluded.revoked_at),
+            "expires_at": func.greatest(TokenRevocation.expires_at, stmt.excluded.expires_at),
+        },
+    ).returning(TokenRevocation.key).cte("revoked")
+    await db.execute(select(func.pg_notify(CHANNEL, payload)).select_from(upserted))
+    token_denylist.add(key, revoked_at, expires_at)
+    TOKEN_REVOCATIONS.inc(kind=key.split(":", 1)[0], source="local")
+
+
+async def revoke_session_tokens(db: AsyncSession, session_id: str) -> None:
+    """Deny every access token issued for a session (logout)."""
+    await _revoke(db, f"sid:{session_id}")
+
+
+async def revoke_user_tokens(db: AsyncSession, user_id: str) -> None:
+    """Deny every access token issued to a user up to now (password reset)."""
+    await _revoke(db, f"sub:{user_id}")
+
+
+def _on_notify(payload: str) -> None:
+    try:
+        entry = orjson.loads(payload)
+        token_denylist.add(entry["k"], entry["r"], entry["e"])
+    except (orjson.JSONDecodeError, KeyError, TypeError) as e:
+        logging.warning("Ignoring malformed revocation notification %r: %s", payload, e)
+        return
+    TOKEN_REVOCATIONS.inc(kind=entry["k"].split(":", 1)[0], source="notify")
+
+
+async def _load(conn) -> None:
+    # Runs after LISTEN, so nothing published in between is missed
+    rows = await conn.fetch(
+        "SELECT key, extract(epoch FROM revoked_at)::float8, extract(epoch FROM expires_at)::float8 "
+        "FROM token_revocation WHERE expires_at > now() AT TIME ZONE 'utc'"
+    )
+    for key, revoked_at, expires_at in rows:
+        token_denylist.add(key, revoked_at, expires_at)
+    logging.info("Loaded %s token revocations", len(rows))
+
+
+async def _purge(conn) -> None:
+    await conn.execute("DELETE FROM token_revocation WHERE expires_at < now() AT TIME ZONE 'utc'")
+
+
+notification_listener.subscribe(CHANNEL, _on_notify, on_connect=_load)
+notification_listener.add_maintenance(_purge)
@@ -0,0 +1,78 @@
+import enum
+import time
+from typing import Callable, Optional
+
+
+class CircuitState(enum.IntEnum):
+    CLOSED = 0
+    HALF_OPEN = 1
+    OPEN = 2
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a dependency whose circuit is open."""
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker. Calls slower than `slow_call_seconds`
+    count as failures even when they succeed. After `failure_threshold`
+    failures in a row the circuit opens for `reset_timeout` seconds, then lets
+    a single trial call through (half-open): success closes it, failure
+    re-opens it. Not thread-safe; meant for use on one event loop.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        slow_call_seconds: Optional[float] = None,
+        reset_timeout: float = 30.0,
+        on_state_change: Optional[Callable[[str, CircuitState], None]] = None,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.slow_call_seconds = slow_call_seconds
+        self.reset_timeout = reset_timeout
+        self.on_state_change = on_state_change
+        self.state = CircuitState.CLOSED
+        self.consecutive_failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    def _transition(self, state: CircuitState) -> None:
+        if state != self.state:
+            self.state = state
+            if self.on_state_change:
+                self.on_state_change(self.name, state)
+
+    def allow_request(self) -> bool:
+        if self.state == CircuitState.CLOSED:
+            return True
+        if self.state == CircuitState.OPEN:
+            if time.monotonic() - self._opened_at < self.reset_timeout:
+                return False
+            self._transition(CircuitState.HALF_OPEN)
+        if self._trial_in_flight:
+            return False
+        self._trial_in_flight = True
+        return True
+
+    def record_success(self, elapsed: float) -> None:
+        if self.slow_call_seconds is not None and elapsed > self.slow_call_seconds:
+            self.record_failure()
+            return
+        self._trial_in_flight = False
+        self.consecutive_failures = 0
+        self._transition(CircuitState.CLOSED)
+
+    def record_abandoned(self) -> None:
+        """The call was cancelled before completing; free the half-open trial slot."""
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self._trial_in_flight = False
+        self.consecutive_failures += 1
+        if self.state == CircuitState.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+            self._transition(CircuitState.OPEN)
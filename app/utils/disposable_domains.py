@@ -0,0 +1,96 @@
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import FrozenSet, Optional
+
+from app.core.config import settings
+
+BUNDLED_DOMAINS_FILE = Path(__file__).resolve().parent.parent / "data" / "disposable_domains.txt"
+
+
+def _load_domains(path: Path) -> FrozenSet[str]:
+    domains = set()
+    with path.open(encoding="utf-8") as fh:
+        for line in fh:
+            domain = line.split("#", 1)[0].strip().lower().lstrip("*.").rstrip(".")
+            if domain:
+                domains.add(domain)
+    return frozenset(domains)
+
+
+class DisposableDomainIndex:
+    """
+    Set of disposable email domains loaded from a text file.
+    Lookups match the domain itself and every parent domain, so
+    "a.b.mailinator.com" is caught by a "mailinator.com" entry.
+    The file is re-read when its mtime changes, checked at most once
+    per `reload_interval` seconds.
+    """
+
+    def __init__(self, path: Path, reload_interval: float = 30.0):
+        self.path = path
+        self.reload_interval = reload_interval
+        self._domains: FrozenSet[str] = frozenset()
+        self._mtime: Optional[float] = None
+        self._next_check = 0.0
+        self._lock = threading.Lock()
+        self.reload(force=True)
+
+    def __len__(self) -> int:
+        return len(self._domains)
+
+    def reload(self, force: bool = False) -> bool:
+        """Reload the domain file if it changed. Returns True if reloaded."""
+        with self._lock:
+            self._next_check = time.monotonic() + self.reload_interval
+            try:
+                mtime = os.stat(self.path).st_mtime
+            except OSError as e:
+                logging.warning("Disposable domain file unavailable (%s): %s", self.path, e)
+                return False
+            if not force and mtime == self._mtime:
+                return False
+            try:
+                domains = _load_domains(self.path)
+            except (OSError, UnicodeDecodeError) as e:
+                logging.error("Failed to load disposable domains from %s: %s", self.path, e)
+                return False
+            self._domains = domains
+            self._mtime = mtime
+        logging.info("Loaded %s disposable domains from %s", len(domains), self.path)
+        return True
+
+    def is_disposable(self, domain: str) -> bool:
+        if time.monotonic() >= self._next_check:
+            self.reload()
+        domains = self._domains
+        labels = domain.lower().strip().rstrip(".").split(".")
+        for i in range(len(labels)):
+            if ".".join(labels[i:]) in domains:
+                return True
+        return False
+
+    def is_disposable_email(self, email: str) -> bool:
+        _, sep, domain = email.rpartition("@")
+        return bool(sep) and self.is_disposable(domain)
+
+
+_index: Optional[DisposableDomainIndex] = None
+
+
+def get_disposable_domain_index() -> DisposableDomainIndex:
+    """Return the process-wide index, creating it on first use."""
+    global _index
+    if _index is None:
+        path = Path(settings.DISPOSABLE_DOMAINS_FILE or BUNDLED_DOMAINS_FILE)
+        _index = DisposableDomainIndex(path, settings.DISPOSABLE_DOMAINS_RELOAD_INTERVAL)
+    return _index
+
+
+def reject_disposable_email(email: str) -> str:
+    """Pydantic validator helper: raise ValueError for disposable addresses."""
+    if get_disposable_domain_index().is_disposable_email(email):
+        raise ValueError("Disposable email addresses are not allowed")
+    return email
@@ -0,0 +1,3 @@
+def normalize_email(email: str) -> str:
+    """Canonical form used for storage and lookups: trimmed and lowercased."""
+    return email.strip().lower()
@@ -1,5 +0,0 @@
-import cuid
-
-
-def generate_cuid() -> str:
-    return cuid.cuid()
@@ -1,23 +1,35 @@
-from datetime import datetime, timedelta
-from typing import Any, Dict
-from jose import jwt, JWTError
+import time
+import uuid
+from datetime import timedelta
+from typing import Any, Dict, Optional
 from app.core.config import settings
+from app.core.token_denylist import token_denylist
+from app.utils.lazy_import import lazy_import
+
+jwt = lazy_import("jose.jwt")
+jose_exceptions = lazy_import("jose.exceptions")
 
 ALGORITHM = "HS256"
+ACCESS_TOKEN_TTL = timedelta(minutes=30)
+REFRESH_TOKEN_TTL = timedelta(days=7)
 
 
-def create_access_token(data: dict) -> str:
-    expire = datetime.utcnow() + timedelta(minutes=30)
+def _encode(data: dict, ttl: timedelta, secret: str) -> str:
+    now = time.time()
     to_encode = data.copy()
-    to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, settings.JWT_ACCESS_TOKEN_SECRET, algorithm=ALGORITHM)
+    # Millisecond iat (NumericDate may be fractional): a "sub" revocation
+    # compares against it, and whole seconds would deny a token issued
+    # just after a password reset in the same second
+    to_encode.update({"exp": int(now + ttl.total_seconds()), "iat": round(now, 3), "jti": uuid.uuid4().hex})
+    return jwt.encode(to_encode, secret, algorithm=ALGORITHM)
+
+
+def create_access_token(data: dict) -> str:
+    return _encode(data, ACCESS_TOKEN_TTL, settings.JWT_ACCESS_TOKEN_SECRET)
 
 
 def create_refresh_token(data: dict) -> str:
-    expire = datetime.utcnow() + timedelta(days=7)
-    to_encode = data.copy()
-    to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, settings.JWT_REFRESH_TOKEN_SECRET, algorithm=ALGORITHM)
+    return _encode(data, REFRESH_TOKEN_TTL, settings.JWT_REFRESH_TOKEN_SECRET)
 
 
 def decode_access_token(token: str) -> Dict[str, Any]:
@@ -25,9 +37,20 @@ def decode_access_token(token: str) -> Dict[str, Any]:
         payload = jwt.decode(
             token, settings.JWT_ACCESS_TOKEN_SECRET, algorithms=[ALGORITHM]
         )
-        return payload
-    except JWTError:
+    except jose_exceptions.JWTError:
+        return None  # type: ignore
+    # Revoked by logout or password reset; local lookup, no DB hit
+    if token_denylist.is_revoked(payload):
         return None  # type: ignore
+    return payload
+
+
+def unverified_claims(token: str) -> Optional[Dict[str, Any]]:
+    """Claims without checking the signature; only for routing, never for auth."""
+    try:
+        return jwt.get_unverified_claims(token)
+    except jose_exceptions.JWTError:
+        return None
 
 
 def decode_refresh_token(token: str) -> Dict[str, Any]:
@@ -36,5 +59,5 @@ def decode_refresh_token(token: str) -> Dict[str, Any]:
             token, settings.JWT_REFRESH_TOKEN_SECRET, algorithms=[ALGORITHM]
         )
         return payload
-    except JWTError:
+    except jose_exceptions.JWTError:
         return None  # type: ignore
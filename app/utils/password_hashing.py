@@ -0,0 +1,12 @@
+from app.utils.lazy_import import lazy_import
+
+# passlib resolves and loads the argon2 backend on first use
+_handlers = lazy_import("passlib.handlers.argon2")
+
+
+def hash_password(password: str) -> str:
+    return _handlers.argon2.hash(password)
+
+
+def verify_password(password: str, hashed: str) -> bool:
+    return _handlers.argon2.verify(password, hashed)
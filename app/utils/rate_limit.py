@@ -0,0 +1,38 @@
+import logging
+import time
+from typing import Dict, Tuple
+
+from app.core.redis_client import get_redis
+
+# Fallback when Redis is not configured: limits then apply per worker
+_local_windows: Dict[str, int] = {}
+
+
+async def hit_fixed_window(key: str, limit: int, window: int = 60) -> Tuple[bool, int]:
+    """
+    Count one hit against `key` in the current fixed window.
+    Returns (allowed, seconds until the window resets). Uses one Redis
+    INCR + EXPIRE round trip; fails open if Redis is unavailable.
+    """
+    now = time.time()
+    bucket = int(now // window)
+    retry_after = max(1, int((bucket + 1) * window - now))
+    window_key = f"{key}:{bucket}"
+    redis = get_redis()
+    if redis is not None:
+        try:
+            async with redis.pipeline(transaction=False) as pipe:
+                pipe.incr(window_key)
+                pipe.expire(window_key, window + 1)
+                count, _ = await pipe.execute()
+        except Exception as e:
+            logging.warning("Rate limit check failed for %s, allowing: %r", key, e)
+            return True, retry_after
+    else:
+        if len(_local_windows) > 10_000:
+            suffix = f":{bucket}"
+            for k in [k for k in _local_windows if not k.endswith(suffix)]:
+                del _local_windows[k]
+        count = _local_windows.get(window_key, 0) + 1
+        _local_windows[window_key] = count
+    return count <= limit, retry_after
@@ -0,0 +1,63 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+from app.core.metrics import Counter
+
+T = TypeVar("T")
+
+SINGLE_FLIGHT = Counter(
+    "single_flight_calls_total",
+    "Keyed operations, by group and whether they ran or joined one already in flight",
+    ["group", "result"],
+)
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls for the same key: the first caller (the
+    leader) runs the operation, callers arriving while it is in flight wait
+    for it and get the same result or exception. Nothing is cached; the
+    key is released as soon as the leader finishes. If the leader is
+    cancelled (client went away) the waiters don't inherit that: the next
+    one in line runs its own operation instead. Per worker, on one event loop.
+    """
+
+    def __init__(self, group: str):
+        self.group = group
+        self._in_flight: Dict[Hashable, "asyncio.Future[Any]"] = {}
+
+    def __len__(self) -> int:
+        return len(self._in_flight)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        while True:
+            future = self._in_flight.get(key)
+            if future is None:
+                break
+            SINGLE_FLIGHT.inc(group=self.group, result="shared")
+            try:
+                # Shielded so one impatient waiter can't cancel it for the rest
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise  # this waiter itself was cancelled
+                # Leader was cancelled: retry, possibly as the new leader
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        SINGLE_FLIGHT.inc(group=self.group, result="leader")
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved, so an unshared failure isn't logged as unhandled
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._in_flight[key]
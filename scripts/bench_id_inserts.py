@@ -0,0 +1,66 @@
+"""
+Insert throughput and primary-key index locality for each ID strategy.
+
+    uv run python scripts/bench_id_inserts.py [--rows 200000] [--batch 1000]
+
+Uses DATABASE_URL from Settings. Each strategy inserts into its own
+temporary table. The report shows rows/s and the final primary-key index
+size. Random keys (cuid, uuid4) split pages all over the B-tree and leave
+a larger, half-empty index. Time-ordered uuid7 keys append to the right-most
+leaf. The legacy cuid row only appears when the `cuid` package is installed.
+"""
+import argparse
+import asyncio
+import time
+from typing import Callable, Dict, Tuple
+
+import asyncpg
+
+from app.core.config import settings
+from app.utils.generate_id import uuid4, uuid7
+
+STRATEGIES: Dict[str, Tuple[str, Callable[[], str]]] = {
+    "uuid4": ("uuid", uuid4),
+    "uuid7": ("uuid", uuid7),
+}
+try:
+    import cuid  # type: ignore
+
+    STRATEGIES["cuid (legacy)"] = ("text", cuid.cuid)
+except ImportError:
+    pass
+
+
+async def bench(conn: asyncpg.Connection, name: str, column_type: str, generate, rows: int, batch: int):
+    table = "bench_ids_" + name.split()[0]
+    await conn.execute(f"DROP TABLE IF EXISTS {table}")
+    await conn.execute(
+        f"CREATE TEMP TABLE {table} (id {column_type} PRIMARY KEY, created_at timestamp DEFAULT now())"
+    )
+    start = time.perf_counter()
+    for offset in range(0, rows, batch):
+        records = [(generate(),) for _ in range(min(batch, rows - offset))]
+        await conn.copy_records_to_table(table, records=records, columns=["id"])
+    elapsed = time.perf_counter() - start
+    index_bytes = await conn.fetchval(f"SELECT pg_relation_size('{table}_pkey')")
+    await conn.execute(f"DROP TABLE {table}")
+    print(f"{name:15s} {rows / elapsed:12,.0f} rows/s   pkey index {index_bytes / 1024 / 1024:8.2f} MB")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--batch", type=int, default=1_000)
+    args = parser.parse_args()
+
+    dsn = settings.async_db_uri.replace("postgresql+asyncpg://", "postgresql://")
+    conn = await asyncpg.connect(dsn)
+    try:
+        for name, (column_type, generate) in STRATEGIES.items():
+            await bench(conn, name, column_type, generate, args.rows, args.batch)
+    finally:
+        await conn.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,73 @@
+"""
+Compare the response path of /login and /verify-otp before and after the
+switch to ORJSONResponse and prebuilt bodies.
+
+Only the serialization layer is measured: the routes below return the same
+payloads as the real endpoints without touching the database.
+
+    uv run python scripts/bench_responses.py [iterations]
+"""
+import sys
+import time
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.responses import ORJSONResponse, json_bytes_response
+from app.schemas.login_schema import LoginResponse
+from app.schemas.otp_schema import OtpVerifyResponse, EMAIL_VERIFIED_BODY
+
+ACCESS_TOKEN = "eyJhbGciOiJIUzI1NiJ9." + "x" * 120 + ".sig"
+
+
+def build_default_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/login", response_model=LoginResponse)
+    async def login():
+        return LoginResponse(access_token=ACCESS_TOKEN)
+
+    @app.post("/verify-otp", response_model=OtpVerifyResponse)
+    async def verify_otp():
+        return OtpVerifyResponse(message="Email verified successfully.")
+
+    return app
+
+
+def build_fast_app() -> FastAPI:
+    app = FastAPI(default_response_class=ORJSONResponse)
+
+    @app.post("/login", response_model=LoginResponse)
+    async def login():
+        return ORJSONResponse(LoginResponse(access_token=ACCESS_TOKEN))
+
+    @app.post("/verify-otp", response_model=OtpVerifyResponse)
+    async def verify_otp():
+        return json_bytes_response(EMAIL_VERIFIED_BODY)
+
+    return app
+
+
+def run(client: TestClient, path: str, iterations: int) -> float:
+    for _ in range(200):
+        client.post(path)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        client.post(path)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    with TestClient(build_default_app()) as default, TestClient(build_fast_app()) as fast:
+        for path in ("/login", "/verify-otp"):
+            before = run(default, path, iterations)
+            after = run(fast, path, iterations)
+            print(
+                f"{path:12s} default {before:8.1f} us/req   "
+                f"orjson {after:8.1f} us/req   saving {before - after:6.1f} us/req"
+            )
+
+
+if __name__ == "__main__":
+    main()
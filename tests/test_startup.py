@@ -0,0 +1,35 @@
+import json
+import os
+import subprocess
+import sys
+
+from app.cli.startup_report import measure_once, summarize
+
+# Generous enough for a loaded CI runner; tighten with IMPORT_BUDGET_MS
+IMPORT_BUDGET_MS = float(os.environ.get("IMPORT_BUDGET_MS", "2000"))
+
+# Deferred with lazy_import: their bodies (and what they pull in) must not
+# run until a request first needs them
+LAZY_MODULES = ["jose.jwt", "passlib.handlers.argon2"]
+HEAVY_DEPENDENCIES = ["jose.jws", "argon2"]
+
+CHECK_LAZY = f"""
+import json, sys
+import app.main
+print(json.dumps({{
+    "loaded": [m for m in {LAZY_MODULES!r} if m in sys.modules and type(sys.modules[m]).__name__ != "_LazyModule"],
+    "heavy": [m for m in {HEAVY_DEPENDENCIES!r} if m in sys.modules],
+}}))
+"""
+
+
+def test_app_import_within_budget():
+    # Fastest of three cold imports, as app.cli.startup_report reports it
+    total_us = min(summarize(measure_once("app.main"))[0] for _ in range(3))
+    assert total_us / 1000 <= IMPORT_BUDGET_MS, f"import app.main took {total_us / 1000:.0f} ms"
+
+
+def test_heavy_modules_stay_lazy():
+    proc = subprocess.run([sys.executable, "-c", CHECK_LAZY], capture_output=True, text=True, check=True)
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    assert result == {"loaded": [], "heavy": []}